@@ -17,19 +17,39 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import dispatcher_send
 
+from .base import ENTITY_PLANS, DeviceStatusVersion
+from .battery import FleetBatteryIndex
 from .const import (
+    CAMERA_PREFETCH_DPCODES,
     CONF_APP_TYPE,
     CONF_ENDPOINT,
+    CONF_SAMPLE_SIZE,
+    CONF_SAMPLED_DPCODES,
     CONF_TERMINAL_ID,
     CONF_TOKEN_INFO,
     CONF_USER_CODE,
+    DEFAULT_SAMPLE_SIZE,
+    DEFAULT_SAMPLED_DPCODES,
     DOMAIN,
+    LOCK_CATEGORIES,
     LOGGER,
     PLATFORMS,
     TUYA_CLIENT_ID,
     TUYA_DISCOVERY_NEW,
+    TUYA_HA_SIGNAL_BATTERY_SUMMARY,
+    TUYA_HA_SIGNAL_CAMERA_TRIGGER,
+    TUYA_HA_SIGNAL_LOCK_EVENT,
     TUYA_HA_SIGNAL_UPDATE_ENTITY,
 )
+from .event_log import LockEventLog, async_remove_event_log
+from .history import DeviceSampleHistory
+from .lock_events import LockEventTracker
+from .members import LockMemberDirectory, async_remove_lock_members
+from .polling import LockStatusPoller
+from .scene_trigger import SceneTrigger
+from .services import async_setup_services
+from .status_snapshots import DeviceStatusSnapshots, async_remove_status_snapshots
+from .storage import CompactDeviceStore
 
 # Suppress logs from the library, it logs unneeded on error
 logging.getLogger("tuya_sharing").setLevel(logging.CRITICAL)
@@ -40,6 +60,8 @@ class HomeAssistantTuyaData(NamedTuple):
 
     manager: Manager
     listener: SharingDeviceListener
+    scene_trigger: SceneTrigger
+    status_snapshots: DeviceStatusSnapshots
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -48,7 +70,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryAuthFailed("Authentication failed. Please re-authenticate.")
 
     token_listener = TokenListener(hass, entry)
-    manager = Manager(
+    manager = TuyaManager(
         TUYA_CLIENT_ID,
         entry.data[CONF_USER_CODE],
         entry.data[CONF_TERMINAL_ID],
@@ -57,7 +79,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         token_listener,
     )
 
-    listener = DeviceListener(hass, manager)
+    history = DeviceSampleHistory(
+        entry.options.get(CONF_SAMPLED_DPCODES, DEFAULT_SAMPLED_DPCODES),
+        entry.options.get(CONF_SAMPLE_SIZE, DEFAULT_SAMPLE_SIZE),
+    )
+    event_log = LockEventLog(hass, entry.entry_id)
+    await event_log.async_load()
+    batteries = FleetBatteryIndex(
+        f"{TUYA_HA_SIGNAL_BATTERY_SUMMARY}_{entry.entry_id}"
+    )
+    members = LockMemberDirectory(hass, manager, entry.entry_id)
+    await members.async_load()
+    status_snapshots = DeviceStatusSnapshots(hass, manager, entry.entry_id)
+    await status_snapshots.async_load()
+    listener = DeviceListener(hass, manager, history, event_log, batteries, members)
     manager.add_device_listener(listener)
 
     # Get all devices from Tuya
@@ -71,9 +106,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             raise ConfigEntryAuthFailed(msg) from exc
         raise
 
+    # Share product schemas between devices and compact their status
+    for device in manager.device_map.values():
+        listener.store.compact(device)
+        batteries.update(device)
+        if device.category in LOCK_CATEGORIES:
+            listener.lock_events.seed(device)
+        # The current values of camera trigger DPs are not triggers
+        listener.camera_triggered(device)
+
     # Connection is successful, store the manager & listener
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = HomeAssistantTuyaData(
-        manager=manager, listener=listener
+        manager=manager,
+        listener=listener,
+        scene_trigger=SceneTrigger(hass, manager),
+        status_snapshots=status_snapshots,
     )
 
     # Cleanup device registry
@@ -91,18 +138,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_setup_services(hass)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    # Fetch the members of locks, to name the users of unlocks
+    members.async_start(entry)
+
+    # Poll locks for status updates that weren't pushed
+    poller = LockStatusPoller(hass, manager, listener)
+    poller.async_start()
+    entry.async_on_unload(poller.async_stop)
+
     # If the device does not register any entities, the device does not need to subscribe
     # So the subscription is here
     await hass.async_add_executor_job(manager.refresh_mq)
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options without reloading the config entry."""
+    tuya: HomeAssistantTuyaData = hass.data[DOMAIN][entry.entry_id]
+    tuya.listener.history.configure(
+        entry.options.get(CONF_SAMPLED_DPCODES, DEFAULT_SAMPLED_DPCODES),
+        entry.options.get(CONF_SAMPLE_SIZE, DEFAULT_SAMPLE_SIZE),
+    )
+
+
 async def cleanup_device_registry(hass: HomeAssistant, device_manager: Manager) -> None:
     """Remove deleted device registry entry if there are no remaining entities."""
     device_registry = dr.async_get(hass)
     for dev_id, device_entry in list(device_registry.devices.items()):
         for item in device_entry.identifiers:
-            if item[0] == DOMAIN and item[1] not in device_manager.device_map:
+            # Devices of config entries themselves are kept
+            if (
+                item[0] == DOMAIN
+                and item[1] not in device_manager.device_map
+                and item[1] not in device_entry.config_entries
+            ):
                 device_registry.async_remove_device(dev_id)
                 break
 
@@ -114,15 +186,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if tuya.manager.mq is not None:
             tuya.manager.mq.stop()
         tuya.manager.remove_device_listener(tuya.listener)
+        await tuya.listener.event_log.async_flush()
         del hass.data[DOMAIN][entry.entry_id]
+        # Product schemas are read again on the next setup
+        ENTITY_PLANS.clear()
     return unload_ok
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a config entry.
 
-    This will revoke the credentials from Tuya.
+    This will revoke the credentials from Tuya, and remove the stored data.
     """
+    # Imported here, the scene platform imports this module
+    from .scene import async_remove_scenes  # pylint: disable=import-outside-toplevel
+
+    await async_remove_event_log(hass, entry.entry_id)
+    await async_remove_lock_members(hass, entry.entry_id)
+    await async_remove_scenes(hass, entry.entry_id)
+    await async_remove_status_snapshots(hass, entry.entry_id)
     manager = Manager(
         TUYA_CLIENT_ID,
         entry.data[CONF_USER_CODE],
@@ -133,29 +215,127 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.async_add_executor_job(manager.unload)
 
 
+class TuyaManager(Manager):
+    """Manager that tells device listeners which DPs a device reported."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init TuyaManager."""
+        super().__init__(*args, **kwargs)
+        self.reported: dict[str, list[str]] = {}
+
+    def _on_device_report(self, device_id: str, status: list) -> None:
+        """Keep the codes of the reported DPs while the listeners are called."""
+        if (device := self.device_map.get(device_id)) is None:
+            return
+        codes = []
+        for item in status:
+            if "code" in item:
+                codes.append(item["code"])
+            elif device.support_local and item.get("dpId") in device.local_strategy:
+                codes.append(device.local_strategy[item["dpId"]]["status_code"])
+        # Reports are handled one at a time, in the MQ thread
+        self.reported[device_id] = codes
+        try:
+            super()._on_device_report(device_id, status)
+        finally:
+            del self.reported[device_id]
+
+
 class DeviceListener(SharingDeviceListener):
     """Device Update Listener."""
 
     def __init__(
         self,
         hass: HomeAssistant,
-        manager: Manager,
+        manager: TuyaManager,
+        history: DeviceSampleHistory,
+        event_log: LockEventLog,
+        batteries: FleetBatteryIndex,
+        members: LockMemberDirectory,
     ) -> None:
         """Init DeviceListener."""
         self.hass = hass
         self.manager = manager
-
-    def update_device(self, device: CustomerDevice) -> None:
+        self.history = history
+        self.event_log = event_log
+        self.batteries = batteries
+        self.members = members
+        self.lock_events = LockEventTracker(members.resolve)
+        self.status_versions: dict[str, DeviceStatusVersion] = {}
+        self.store = CompactDeviceStore()
+        self.camera_trigger_values: dict[str, dict[str, Any]] = {}
+
+    def get_status_version(self, device_id: str) -> DeviceStatusVersion:
+        """Return the status version tracker of a device."""
+        if (status_version := self.status_versions.get(device_id)) is None:
+            status_version = self.status_versions[device_id] = DeviceStatusVersion()
+        return status_version
+
+    def update_device(
+        self,
+        device: CustomerDevice,
+        updated_status_properties: list[str] | None = None,
+    ) -> None:
         """Update device status."""
+        if updated_status_properties is None:
+            # The SDK doesn't pass the reported DPs to listeners
+            updated_status_properties = self.manager.reported.get(device.id)
         LOGGER.debug(
             "Received update for device %s: %s",
             device.id,
             self.manager.device_map[device.id].status,
         )
+        self.get_status_version(device.id).bump(updated_status_properties)
+        self.history.record(device, updated_status_properties)
         dispatcher_send(self.hass, f"{TUYA_HA_SIGNAL_UPDATE_ENTITY}_{device.id}")
+        if self.batteries.update(device, updated_status_properties):
+            dispatcher_send(self.hass, self.batteries.signal)
+        if self.camera_triggered(device, updated_status_properties):
+            dispatcher_send(self.hass, f"{TUYA_HA_SIGNAL_CAMERA_TRIGGER}_{device.id}")
+        if device.category in LOCK_CATEGORIES:
+            for event in self.lock_events.process(device, updated_status_properties):
+                dispatcher_send(
+                    self.hass, f"{TUYA_HA_SIGNAL_LOCK_EVENT}_{device.id}", event
+                )
+                self.event_log.append(event)
+
+    def camera_triggered(
+        self, device: CustomerDevice, changed: list[str] | None = None
+    ) -> bool:
+        """Return if a DP that prefetches camera images was reported.
+
+        Without knowing which DPs were reported, a DP is only considered
+        reported when its value changed.
+        """
+        values = {
+            dpcode: device.status[dpcode]
+            for dpcode in CAMERA_PREFETCH_DPCODES
+            if dpcode in device.status
+        }
+        if not values:
+            return False
+        previous = self.camera_trigger_values.get(device.id)
+        self.camera_trigger_values[device.id] = values
+        return any(
+            value
+            and (
+                dpcode in changed
+                if changed is not None
+                else previous is not None and previous.get(dpcode) != value
+            )
+            for dpcode, value in values.items()
+        )
 
     def add_device(self, device: CustomerDevice) -> None:
         """Add device added listener."""
+        self.store.compact(device)
+        if self.batteries.update(device):
+            dispatcher_send(self.hass, self.batteries.signal)
+        if device.category in LOCK_CATEGORIES:
+            self.lock_events.seed(device)
+        # The current values of camera trigger DPs are not triggers
+        self.camera_triggered(device)
+
         # Ensure the device isn't present stale
         self.hass.add_job(self.async_remove_device, device.id)
 
@@ -163,6 +343,12 @@ class DeviceListener(SharingDeviceListener):
 
     def remove_device(self, device_id: str) -> None:
         """Add device removed listener."""
+        self.status_versions.pop(device_id, None)
+        self.history.remove(device_id)
+        self.lock_events.remove(device_id)
+        self.camera_trigger_values.pop(device_id, None)
+        if self.batteries.remove(device_id):
+            dispatcher_send(self.hass, self.batteries.signal)
         self.hass.add_job(self.async_remove_device, device_id)
 
     @callback
@@ -1,19 +1,21 @@
 """Tuya Home Assistant Base Device Model."""
 from __future__ import annotations
 
-import base64
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass
+from functools import wraps
 import json
-import struct
-from typing import Any, Literal, Self, overload
+from typing import Any, Literal, Self, TypeVar, overload
 
 from tuya_sharing import CustomerDevice, Manager
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity import Entity, EntityDescription
 
 from .const import DOMAIN, LOGGER, TUYA_HA_SIGNAL_UPDATE_ENTITY, DPCode, DPType
+from .raw import PHASE_CODEC
 from .util import remap_value
 
 
@@ -120,13 +122,56 @@ class ElectricityTypeData:
     @classmethod
     def from_raw(cls, data: str) -> Self:
         """Decode base64 string and return a ElectricityTypeData object."""
-        raw = base64.b64decode(data)
-        voltage = struct.unpack(">H", raw[0:2])[0] / 10.0
-        electriccurrent = struct.unpack(">L", b"\x00" + raw[2:5])[0] / 1000.0
-        power = struct.unpack(">L", b"\x00" + raw[5:8])[0] / 1000.0
-        return cls(
-            electriccurrent=str(electriccurrent), power=str(power), voltage=str(voltage)
-        )
+        if (values := PHASE_CODEC.decode(data)) is None:
+            return cls()
+        return cls(**{key: str(value) for key, value in values.items()})
+
+
+@dataclass
+class DeviceStatusVersion:
+    """Monotonic version of the status of a Tuya device."""
+
+    version: int = 0
+    changed: frozenset[str] | None = None
+
+    def bump(self, changed: Iterable[str] | None = None) -> None:
+        """Mark the device status as changed, optionally with the changed DPs."""
+        self.changed = frozenset(changed) if changed is not None else None
+        self.version += 1
+
+
+_TuyaEntityT = TypeVar("_TuyaEntityT", bound="TuyaEntity")
+_R = TypeVar("_R")
+_PlanT = TypeVar("_PlanT")
+
+# Entity plans, compiled once per entity class, product and description.
+ENTITY_PLANS: dict[tuple[Hashable, ...], Any] = {}
+
+
+def status_cached(
+    func: Callable[[_TuyaEntityT], _R]
+) -> Callable[[_TuyaEntityT], _R]:
+    """Cache the result of an entity method until the device status changes.
+
+    Wrap a property getter with it to opt in, the cached value is
+    invalidated as soon as the status version of the device is bumped.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self: _TuyaEntityT) -> _R:
+        if (status_version := self.status_version) is None:
+            return func(self)
+        version = status_version.version
+        if (cached := self._status_cache.get(name)) is not None and (
+            cached[0] == version
+        ):
+            return cached[1]
+        result = func(self)
+        self._status_cache[name] = (version, result)
+        return result
+
+    return wrapper
 
 
 class TuyaEntity(Entity):
@@ -135,6 +180,8 @@ class TuyaEntity(Entity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
+    status_version: DeviceStatusVersion | None = None
+
     def __init__(self, device: CustomerDevice, device_manager: Manager) -> None:
         """Init TuyaHaEntity."""
         self._attr_unique_id = f"tuya.{device.id}"
@@ -142,6 +189,24 @@ class TuyaEntity(Entity):
         device.set_up = True
         self.device = device
         self.device_manager = device_manager
+        self._status_cache: dict[str, tuple[int, Any]] = {}
+
+    def get_entity_plan(
+        self,
+        description: EntityDescription,
+        compile_plan: Callable[[], _PlanT],
+        *extra_key: Hashable,
+    ) -> _PlanT:
+        """Return the plan for this entity, compiling it once per product.
+
+        Devices of the same product share a schema, so configuration
+        resolved from it can be shared by all their entities. Entity
+        descriptions are module level constants, thus keyed on identity.
+        """
+        key = (type(self), self.device.product_id, id(description), *extra_key)
+        if (plan := ENTITY_PLANS.get(key)) is None:
+            plan = ENTITY_PLANS[key] = compile_plan()
+        return plan
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -263,14 +328,24 @@ class TuyaEntity(Entity):
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
+        if self.platform.config_entry is not None:
+            hass_data = self.hass.data[DOMAIN][self.platform.config_entry.entry_id]
+            self.status_version = hass_data.listener.get_status_version(
+                self.device.id
+            )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
                 f"{TUYA_HA_SIGNAL_UPDATE_ENTITY}_{self.device.id}",
-                self.async_write_ha_state,
+                self._handle_status_update,
             )
         )
 
+    @callback
+    def _handle_status_update(self) -> None:
+        """Handle an update of the device status."""
+        self.async_write_ha_state()
+
     def _send_command(self, commands: list[dict[str, Any]]) -> None:
         """Send command to the device."""
         LOGGER.debug("Sending commands for device %s: %s", self.device.id, commands)
@@ -0,0 +1,124 @@
+"""Incrementally maintained summary of the batteries of Tuya devices."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from contextlib import suppress
+from threading import Lock
+
+from tuya_sharing import CustomerDevice
+
+from .base import IntegerTypeData
+from .const import BATTERY_HISTOGRAM_BUCKETS, BATTERY_LEVEL_DPCODES
+
+
+class FleetBatteryIndex:
+    """Battery levels of all devices, kept sorted and bucketed.
+
+    Updating the level of a device is a binary search and a list insert,
+    the lowest level and the number of devices below a threshold are
+    available without iterating over the devices.
+    """
+
+    def __init__(self, signal: str) -> None:
+        """Initialize the index."""
+        self.signal = signal
+        self._lock = Lock()
+        self._levels: dict[str, float] = {}
+        self._sorted: list[tuple[float, str]] = []
+        self._histogram = [0] * BATTERY_HISTOGRAM_BUCKETS
+        self._scales: dict[tuple[str, str], IntegerTypeData | None] = {}
+
+    def _level(self, device: CustomerDevice) -> float | None:
+        """Return the battery level of a device, as a percentage."""
+        for dpcode in BATTERY_LEVEL_DPCODES:
+            if (value := device.status.get(dpcode)) is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            if (type_data := self._scale(device, dpcode)) is not None:
+                value = type_data.scale_value(value)
+            return min(max(float(value), 0.0), 100.0)
+        return None
+
+    def _scale(self, device: CustomerDevice, dpcode: str) -> IntegerTypeData | None:
+        """Return the cached integer type of a battery DP of a product."""
+        key = (device.product_id, dpcode)
+        # Updates arrive from the MQ and the poller threads
+        with self._lock:
+            if key in self._scales:
+                return self._scales[key]
+            type_data = None
+            # Malformed ranges are treated as unscaled percentages
+            if (status_range := device.status_range.get(dpcode)) is not None:
+                with suppress(KeyError, TypeError, ValueError):
+                    type_data = IntegerTypeData.from_json(dpcode, status_range.values)
+            self._scales[key] = type_data
+            return type_data
+
+    @staticmethod
+    def _bucket(level: float) -> int:
+        """Return the histogram bucket of a battery level."""
+        return min(
+            int(level * BATTERY_HISTOGRAM_BUCKETS / 100), BATTERY_HISTOGRAM_BUCKETS - 1
+        )
+
+    def update(
+        self, device: CustomerDevice, changed: Iterable[str] | None = None
+    ) -> bool:
+        """Update the battery level of a device, return if it changed."""
+        if changed is not None and not any(
+            dpcode in changed for dpcode in BATTERY_LEVEL_DPCODES
+        ):
+            return False
+        level = self._level(device)
+        with self._lock:
+            if self._levels.get(device.id) == level:
+                return False
+            self._remove(device.id)
+            if level is not None:
+                self._levels[device.id] = level
+                insort(self._sorted, (level, device.id))
+                self._histogram[self._bucket(level)] += 1
+        return True
+
+    def remove(self, device_id: str) -> bool:
+        """Remove a device from the index, return if it was present."""
+        with self._lock:
+            return self._remove(device_id)
+
+    def _remove(self, device_id: str) -> bool:
+        """Remove a device from the index, the lock must be held."""
+        if (level := self._levels.pop(device_id, None)) is None:
+            return False
+        del self._sorted[bisect_left(self._sorted, (level, device_id))]
+        self._histogram[self._bucket(level)] -= 1
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of devices with a known battery level."""
+        return len(self._levels)
+
+    def lowest(self) -> tuple[float, str] | None:
+        """Return the lowest battery level and its device ID."""
+        with self._lock:
+            return self._sorted[0] if self._sorted else None
+
+    def count_below(self, threshold: float) -> int:
+        """Return the number of devices below a threshold."""
+        with self._lock:
+            return bisect_left(self._sorted, (threshold, ""))
+
+    def below(self, threshold: float) -> list[tuple[float, str]]:
+        """Return the levels and device IDs below a threshold, lowest first."""
+        with self._lock:
+            return self._sorted[: bisect_left(self._sorted, (threshold, ""))]
+
+    def histogram(self) -> dict[str, int]:
+        """Return the number of devices per battery level range."""
+        width = 100 // BATTERY_HISTOGRAM_BUCKETS
+        with self._lock:
+            return {
+                f"{index * width}-{(index + 1) * width}": count
+                for index, count in enumerate(self._histogram)
+            }
@@ -1,33 +1,80 @@
 """Support for Tuya cameras."""
 from __future__ import annotations
 
+import asyncio
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
 from tuya_sharing import CustomerDevice, Manager
 
 from homeassistant.components import ffmpeg
 from homeassistant.components.camera import Camera as CameraEntity, CameraEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from . import HomeAssistantTuyaData
 from .base import TuyaEntity
-from .const import DOMAIN, TUYA_DISCOVERY_NEW, DPCode
-
-# All descriptions can be found here:
-# https://developer.tuya.com/en/docs/iot/standarddescription?id=K9i5ql6waswzq
-CAMERAS: tuple[str, ...] = (
-    # Smart Camera (including doorbells)
-    # https://developer.tuya.com/en/docs/iot/categorysgbj?id=Kaiuz37tlpbnu
-    "sp",
+from .const import (
+    CAMERA_CATEGORIES,
+    CAMERA_EVENT_PICTURE_DPCODES,
+    CAMERA_EVENT_PICTURE_MAX_SIZE,
+    CAMERA_EVENT_PICTURE_TIMEOUT,
+    CAMERA_EVENT_PICTURE_WINDOW,
+    CAMERA_PREFETCH_WINDOW,
+    CAMERA_STREAM_URL_MARGIN,
+    CAMERA_STREAM_URL_TTL,
+    CONF_SNAPSHOT_FPS,
+    CONF_SNAPSHOT_GRABBER,
+    CONF_STREAM_TYPE,
+    CONF_STREAM_TYPE_CAMERAS,
+    DEFAULT_SNAPSHOT_FPS,
+    DEFAULT_STREAM_TYPE,
+    DOMAIN,
+    LOGGER,
+    TUYA_DISCOVERY_NEW,
+    TUYA_HA_SIGNAL_CAMERA_TRIGGER,
+    DPCode,
+)
+from .snapshot import (
+    SnapshotCache,
+    SnapshotGrabber,
+    decode_event_picture,
+    is_jpeg,
 )
 
+# Query parameters that may hold the expiry of a stream URL, in seconds or
+# milliseconds since the epoch.
+_EXPIRY_PARAMETERS = ("expire", "expires", "expire_time", "expireTime")
+
+
+def stream_url_expiry(url: str, now: float) -> float:
+    """Return when an allocated stream URL expires."""
+    query = parse_qs(urlsplit(url).query)
+    for parameter in _EXPIRY_PARAMETERS:
+        if values := query.get(parameter):
+            try:
+                expiry = float(values[0])
+            except ValueError:
+                continue
+            if expiry > 1e12:
+                expiry /= 1000
+            if expiry > now:
+                return expiry
+    return now + CAMERA_STREAM_URL_TTL
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Tuya cameras dynamically through Tuya discovery."""
     hass_data: HomeAssistantTuyaData = hass.data[DOMAIN][entry.entry_id]
+    snapshots = SnapshotCache(hass)
 
     @callback
     def async_discover_device(device_ids: list[str]) -> None:
@@ -35,8 +82,10 @@ async def async_setup_entry(
         entities: list[TuyaCameraEntity] = []
         for device_id in device_ids:
             device = hass_data.manager.device_map[device_id]
-            if device.category in CAMERAS:
-                entities.append(TuyaCameraEntity(device, hass_data.manager))
+            if device.category in CAMERA_CATEGORIES:
+                entities.append(
+                    TuyaCameraEntity(device, hass_data.manager, entry, snapshots)
+                )
 
         async_add_entities(entities)
 
@@ -54,15 +103,47 @@ class TuyaCameraEntity(TuyaEntity, CameraEntity):
     _attr_brand = "Tuya"
     _attr_name = None
 
+    _stream_url: str | None = None
+    _stream_url_type: str | None = None
+    _stream_url_expiry = 0.0
+    _stream_url_requested = 0.0
+    _cancel_stream_url_refresh: CALLBACK_TYPE | None = None
+    _snapshot_grabber: SnapshotGrabber | None = None
+    _event_picture_task: asyncio.Task[None] | None = None
+    _event_image: bytes | None = None
+    _event_image_time = 0.0
+
     def __init__(
         self,
         device: CustomerDevice,
         device_manager: Manager,
+        entry: ConfigEntry,
+        snapshots: SnapshotCache,
     ) -> None:
         """Init Tuya Camera."""
         super().__init__(device, device_manager)
         CameraEntity.__init__(self)
         self._attr_model = device.product_name
+        self._entry = entry
+        self._snapshots = snapshots
+        self._unsupported_stream_types: set[str] = set()
+        # Pictures present at startup are of past events, don't fetch them
+        self._event_pictures = {
+            dpcode: device.status.get(dpcode)
+            for dpcode in CAMERA_EVENT_PICTURE_DPCODES
+        }
+        self._stream_url_lock = asyncio.Lock()
+
+    @property
+    def stream_type(self) -> str:
+        """Return the type of stream to allocate, as chosen in the options."""
+        options = self._entry.options
+        if self.device.id not in options.get(CONF_STREAM_TYPE_CAMERAS, []):
+            return "rtsp"
+        stream_type = options.get(CONF_STREAM_TYPE, DEFAULT_STREAM_TYPE)
+        if stream_type in self._unsupported_stream_types:
+            return "rtsp"
+        return stream_type
 
     @property
     def is_recording(self) -> bool:
@@ -74,28 +155,222 @@ class TuyaCameraEntity(TuyaEntity, CameraEntity):
         """Return the camera motion detection status."""
         return self.device.status.get(DPCode.MOTION_SWITCH, False)
 
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{TUYA_HA_SIGNAL_CAMERA_TRIGGER}_{self.device.id}",
+                self._async_handle_trigger,
+            )
+        )
+
+    @callback
+    def _handle_status_update(self) -> None:
+        """Fetch the picture of a new motion or alarm event, write the state."""
+        changed = self.status_version.changed if self.status_version else None
+        for dpcode in CAMERA_EVENT_PICTURE_DPCODES:
+            if changed is not None and dpcode not in changed:
+                continue
+            value = self.device.status.get(dpcode)
+            if value == self._event_pictures[dpcode]:
+                continue
+            self._event_pictures[dpcode] = value
+            if isinstance(value, str) and value:
+                self._event_picture_task = self.hass.async_create_background_task(
+                    self._async_fetch_event_picture(value),
+                    f"tuya camera event picture {self.device.id}",
+                )
+        super()._handle_status_update()
+
+    async def _async_fetch_event_picture(self, value: str) -> None:
+        """Decode or download the picture of an event."""
+        image, url = decode_event_picture(value)
+        if image is None and url is not None:
+            try:
+                async with async_get_clientsession(self.hass).get(
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=CAMERA_EVENT_PICTURE_TIMEOUT),
+                    raise_for_status=True,
+                ) as response:
+                    image = await response.content.read(
+                        CAMERA_EVENT_PICTURE_MAX_SIZE + 1
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                LOGGER.debug("Unable to download an event picture: %s", err)
+                return
+        if image is None:
+            LOGGER.debug("Unsupported event picture of %s", self.device.id)
+            return
+        # Inline pictures are bounded like downloaded ones
+        if len(image) > CAMERA_EVENT_PICTURE_MAX_SIZE or not is_jpeg(image):
+            LOGGER.debug("Ignoring event picture of %s", self.device.id)
+            return
+        self._event_image = image
+        self._event_image_time = time.monotonic()
+        self._snapshots.async_invalidate(self.device.id)
+
+    @callback
+    def _async_handle_trigger(self) -> None:
+        """Prefetch the stream URL and a snapshot after a motion or ring."""
+        self.hass.async_create_background_task(
+            self._async_prefetch(), f"tuya camera prefetch {self.device.id}"
+        )
+
+    async def _async_prefetch(self) -> None:
+        """Prefetch the stream URL and a snapshot, keeping them warm."""
+        if await self.stream_source():
+            await self._snapshots.async_prefetch(
+                self.device.id, self._async_fetch_image, CAMERA_PREFETCH_WINDOW
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the stream URL refresh and stop grabbing when removed."""
+        await super().async_will_remove_from_hass()
+        self._async_cancel_stream_url_refresh()
+        self._async_stop_snapshot_grabber()
+        self._snapshots.async_invalidate(self.device.id)
+
+    @callback
+    def _async_stop_snapshot_grabber(self) -> None:
+        """Stop the snapshot grabber, if any."""
+        if self._snapshot_grabber is not None:
+            self._snapshot_grabber.async_stop()
+            self._snapshot_grabber = None
+
+    @callback
+    def _async_snapshot_grabber(self) -> SnapshotGrabber | None:
+        """Return the snapshot grabber, if enabled in the options."""
+        options = self._entry.options
+        if not options.get(CONF_SNAPSHOT_GRABBER, False):
+            self._async_stop_snapshot_grabber()
+            return None
+        fps = options.get(CONF_SNAPSHOT_FPS, DEFAULT_SNAPSHOT_FPS)
+        if self._snapshot_grabber is not None and self._snapshot_grabber.fps != fps:
+            self._async_stop_snapshot_grabber()
+        if self._snapshot_grabber is None:
+            self._snapshot_grabber = SnapshotGrabber(self.hass, self.stream_source, fps)
+        return self._snapshot_grabber
+
+    @callback
+    def _async_cancel_stream_url_refresh(self) -> None:
+        """Cancel a scheduled refresh of the stream URL."""
+        if self._cancel_stream_url_refresh is not None:
+            self._cancel_stream_url_refresh()
+            self._cancel_stream_url_refresh = None
+
+    @callback
+    def _async_invalidate_stream_url(self) -> None:
+        """Drop the cached stream URL, e.g. after it was refused."""
+        self._stream_url = None
+        self._async_cancel_stream_url_refresh()
+
+    async def _async_allocate_stream_url(self) -> str | None:
+        """Allocate a stream URL, and schedule a refresh before it expires."""
+        async with self._stream_url_lock:
+            now = time.time()
+            stream_type = self.stream_type
+            if (
+                self._stream_url
+                and self._stream_url_type == stream_type
+                and now < self._stream_url_expiry
+            ):
+                # Allocated while waiting for the lock
+                return self._stream_url
+
+            url = await self.hass.async_add_executor_job(
+                self.device_manager.get_device_stream_allocate,
+                self.device.id,
+                stream_type,
+            )
+            if not url and stream_type != "rtsp":
+                LOGGER.info(
+                    "Camera %s doesn't support %s streams, falling back to RTSP",
+                    self.device.name,
+                    stream_type,
+                )
+                self._unsupported_stream_types.add(stream_type)
+                stream_type = "rtsp"
+                url = await self.hass.async_add_executor_job(
+                    self.device_manager.get_device_stream_allocate,
+                    self.device.id,
+                    stream_type,
+                )
+            self._async_cancel_stream_url_refresh()
+            if not url:
+                self._stream_url = None
+                return None
+
+            self._stream_url = url
+            self._stream_url_type = stream_type
+            self._stream_url_expiry = (
+                stream_url_expiry(url, now) - CAMERA_STREAM_URL_MARGIN
+            )
+            self._cancel_stream_url_refresh = async_call_later(
+                self.hass,
+                max(self._stream_url_expiry - now, 0),
+                self._async_refresh_stream_url,
+            )
+            return url
+
+    async def _async_refresh_stream_url(self, _now: Any) -> None:
+        """Refresh the stream URL ahead of expiry, while it is being used."""
+        self._cancel_stream_url_refresh = None
+        if time.time() - self._stream_url_requested > CAMERA_STREAM_URL_TTL:
+            # Nobody asked for the URL lately, allocate on the next request
+            self._stream_url = None
+            return
+        self._stream_url_expiry = 0.0
+        await self._async_allocate_stream_url()
+
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
-        return await self.hass.async_add_executor_job(
-            self.device_manager.get_device_stream_allocate,
-            self.device.id,
-            "rtsp",
-        )
+        self._stream_url_requested = time.time()
+        if (
+            self._stream_url
+            and self._stream_url_type == self.stream_type
+            and self._stream_url_requested < self._stream_url_expiry
+        ):
+            return self._stream_url
+        return await self._async_allocate_stream_url()
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a still image response from the camera."""
-        stream_source = await self.stream_source()
-        if not stream_source:
-            return None
-        return await ffmpeg.async_get_image(
-            self.hass,
-            stream_source,
-            width=width,
-            height=height,
+        return await self._snapshots.async_get_image(
+            self.device.id, self._async_fetch_image, width, height
         )
 
+    async def _async_fetch_image(self) -> bytes | None:
+        """Fetch a full size image from the camera."""
+        if self._event_picture_task is not None:
+            # A picture of an event is on the way, prefer it over the stream
+            await asyncio.shield(self._event_picture_task)
+            self._event_picture_task = None
+        if (
+            self._event_image is not None
+            and time.monotonic() - self._event_image_time < CAMERA_EVENT_PICTURE_WINDOW
+        ):
+            return self._event_image
+
+        if (grabber := self._async_snapshot_grabber()) is not None:
+            if image := await grabber.async_get_image():
+                return image
+            # Fall back to a single image, with a newly allocated URL
+            grabber.async_stop()
+            self._async_invalidate_stream_url()
+
+        for _ in range(2):
+            if not (stream_source := await self.stream_source()):
+                return None
+            if image := await ffmpeg.async_get_image(self.hass, stream_source):
+                return image
+            # The URL was likely refused or expired, allocate a new one
+            self._async_invalidate_stream_url()
+        return None
+
     def enable_motion_detection(self) -> None:
         """Enable motion detection in the camera."""
         self._send_command([{"code": DPCode.MOTION_SWITCH, "value": True}])
@@ -24,7 +24,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HomeAssistantTuyaData
-from .base import IntegerTypeData, TuyaEntity
+from .base import IntegerTypeData, TuyaEntity, status_cached
 from .const import DOMAIN, TUYA_DISCOVERY_NEW, DPCode, DPType
 
 TUYA_HVAC_TO_HA = {
@@ -53,6 +53,28 @@ class TuyaClimateEntityDescription(
     """Describe an Tuya climate entity."""
 
 
+@dataclass(frozen=True)
+class TuyaClimatePlan:
+    """Climate configuration resolved from a product schema."""
+
+    temperature_unit: UnitOfTemperature
+    supported_features: ClimateEntityFeature
+    current_temperature: IntegerTypeData | None
+    set_temperature: IntegerTypeData | None
+    min_temp: float | None
+    max_temp: float | None
+    target_temperature_step: float
+    hvac_modes: tuple[HVACMode, ...]
+    hvac_to_tuya: dict[str, str]
+    preset_modes: tuple[str, ...] | None
+    set_humidity: IntegerTypeData | None
+    min_humidity: int | None
+    max_humidity: int | None
+    current_humidity: IntegerTypeData | None
+    fan_modes: tuple[str, ...] | None
+    swing_modes: tuple[str, ...] | None
+
+
 CLIMATE_DESCRIPTIONS: dict[str, TuyaClimateEntityDescription] = {
     # Air conditioner
     # https://developer.tuya.com/en/docs/iot/categorykt?id=Kaiuz0z71ov2n
@@ -137,7 +159,6 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         system_temperature_unit: UnitOfTemperature,
     ) -> None:
         """Determine which values to use."""
-        self._attr_target_temperature_step = 1.0
         self.entity_description = description
 
         super().__init__(device, device_manager)
@@ -159,10 +180,52 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
             ):
                 prefered_temperature_unit = UnitOfTemperature.FAHRENHEIT
 
+        plan = self.get_entity_plan(
+            description,
+            lambda: self._compile_plan(
+                prefered_temperature_unit, system_temperature_unit
+            ),
+            prefered_temperature_unit,
+            system_temperature_unit,
+        )
+        self._current_temperature = plan.current_temperature
+        self._set_temperature = plan.set_temperature
+        self._current_humidity = plan.current_humidity
+        self._set_humidity = plan.set_humidity
+        self._hvac_to_tuya = plan.hvac_to_tuya
+        self._attr_temperature_unit = plan.temperature_unit
+        self._attr_supported_features = plan.supported_features
+        self._attr_target_temperature_step = plan.target_temperature_step
+        self._attr_hvac_modes = list(plan.hvac_modes)
+        if plan.min_temp is not None:
+            self._attr_min_temp = plan.min_temp
+        if plan.max_temp is not None:
+            self._attr_max_temp = plan.max_temp
+        if plan.min_humidity is not None:
+            self._attr_min_humidity = plan.min_humidity
+        if plan.max_humidity is not None:
+            self._attr_max_humidity = plan.max_humidity
+        if plan.preset_modes is not None:
+            self._attr_preset_modes = list(plan.preset_modes)
+        if plan.fan_modes is not None:
+            self._attr_fan_modes = list(plan.fan_modes)
+        if plan.swing_modes is not None:
+            self._attr_swing_modes = list(plan.swing_modes)
+
+    def _compile_plan(
+        self,
+        prefered_temperature_unit: UnitOfTemperature | None,
+        system_temperature_unit: UnitOfTemperature,
+    ) -> TuyaClimatePlan:
+        """Resolve the climate configuration from the device schema."""
+        description = self.entity_description
+        supported_features = ClimateEntityFeature(0)
+
         # Default to System Temperature Unit
-        self._attr_temperature_unit = system_temperature_unit
+        temperature_unit = system_temperature_unit
 
         # Figure out current temperature, use preferred unit or what is available
+        current_temperature: IntegerTypeData | None = None
         celsius_type = self.find_dpcode(
             (DPCode.TEMP_CURRENT, DPCode.UPPER_TEMP), dptype=DPType.INTEGER
         )
@@ -176,13 +239,14 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
                 and not celsius_type
             )
         ):
-            self._attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
-            self._current_temperature = fahrenheit_type
+            temperature_unit = UnitOfTemperature.FAHRENHEIT
+            current_temperature = fahrenheit_type
         elif celsius_type:
-            self._attr_temperature_unit = UnitOfTemperature.CELSIUS
-            self._current_temperature = celsius_type
+            temperature_unit = UnitOfTemperature.CELSIUS
+            current_temperature = celsius_type
 
         # Figure out setting temperature, use preferred unit or what is available
+        set_temperature: IntegerTypeData | None = None
         celsius_type = self.find_dpcode(
             DPCode.TEMP_SET, dptype=DPType.INTEGER, prefer_function=True
         )
@@ -196,68 +260,73 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
                 and not celsius_type
             )
         ):
-            self._set_temperature = fahrenheit_type
+            set_temperature = fahrenheit_type
         elif celsius_type:
-            self._set_temperature = celsius_type
+            set_temperature = celsius_type
 
         # Get integer type data for the dpcode to set temperature, use
         # it to define min, max & step temperatures
-        if self._set_temperature:
-            self._attr_supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE
-            self._attr_max_temp = self._set_temperature.max_scaled
-            self._attr_min_temp = self._set_temperature.min_scaled
-            self._attr_target_temperature_step = self._set_temperature.step_scaled
+        min_temp = max_temp = None
+        target_temperature_step = 1.0
+        if set_temperature:
+            supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE
+            max_temp = set_temperature.max_scaled
+            min_temp = set_temperature.min_scaled
+            target_temperature_step = set_temperature.step_scaled
 
         # Determine HVAC modes
-        self._attr_hvac_modes: list[HVACMode] = []
-        self._hvac_to_tuya = {}
+        hvac_modes: list[HVACMode] = []
+        hvac_to_tuya: dict[str, str] = {}
+        preset_modes: list[str] | None = None
         if enum_type := self.find_dpcode(
             DPCode.MODE, dptype=DPType.ENUM, prefer_function=True
         ):
-            self._attr_hvac_modes = [HVACMode.OFF]
+            hvac_modes = [HVACMode.OFF]
             unknown_hvac_modes: list[str] = []
             for tuya_mode in enum_type.range:
                 if tuya_mode in TUYA_HVAC_TO_HA:
                     ha_mode = TUYA_HVAC_TO_HA[tuya_mode]
-                    self._hvac_to_tuya[ha_mode] = tuya_mode
-                    self._attr_hvac_modes.append(ha_mode)
+                    hvac_to_tuya[ha_mode] = tuya_mode
+                    hvac_modes.append(ha_mode)
                 else:
                     unknown_hvac_modes.append(tuya_mode)
 
             if unknown_hvac_modes:  # Tuya modes are presets instead of hvac_modes
-                self._attr_hvac_modes.append(description.switch_only_hvac_mode)
-                self._attr_preset_modes = unknown_hvac_modes
-                self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
+                hvac_modes.append(description.switch_only_hvac_mode)
+                preset_modes = unknown_hvac_modes
+                supported_features |= ClimateEntityFeature.PRESET_MODE
         elif self.find_dpcode(DPCode.SWITCH, prefer_function=True):
-            self._attr_hvac_modes = [
+            hvac_modes = [
                 HVACMode.OFF,
                 description.switch_only_hvac_mode,
             ]
 
         # Determine dpcode to use for setting the humidity
-        if int_type := self.find_dpcode(
+        min_humidity = max_humidity = None
+        if set_humidity := self.find_dpcode(
             DPCode.HUMIDITY_SET, dptype=DPType.INTEGER, prefer_function=True
         ):
-            self._attr_supported_features |= ClimateEntityFeature.TARGET_HUMIDITY
-            self._set_humidity = int_type
-            self._attr_min_humidity = int(int_type.min_scaled)
-            self._attr_max_humidity = int(int_type.max_scaled)
+            supported_features |= ClimateEntityFeature.TARGET_HUMIDITY
+            min_humidity = int(set_humidity.min_scaled)
+            max_humidity = int(set_humidity.max_scaled)
 
         # Determine dpcode to use for getting the current humidity
-        self._current_humidity = self.find_dpcode(
+        current_humidity = self.find_dpcode(
             DPCode.HUMIDITY_CURRENT, dptype=DPType.INTEGER
         )
 
         # Determine fan modes
+        fan_modes: list[str] | None = None
         if enum_type := self.find_dpcode(
             (DPCode.FAN_SPEED_ENUM, DPCode.WINDSPEED),
             dptype=DPType.ENUM,
             prefer_function=True,
         ):
-            self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
-            self._attr_fan_modes = enum_type.range
+            supported_features |= ClimateEntityFeature.FAN_MODE
+            fan_modes = enum_type.range
 
         # Determine swing modes
+        swing_modes: list[str] | None = None
         if self.find_dpcode(
             (
                 DPCode.SHAKE,
@@ -267,22 +336,41 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
             ),
             prefer_function=True,
         ):
-            self._attr_supported_features |= ClimateEntityFeature.SWING_MODE
-            self._attr_swing_modes = [SWING_OFF]
+            supported_features |= ClimateEntityFeature.SWING_MODE
+            swing_modes = [SWING_OFF]
             if self.find_dpcode((DPCode.SHAKE, DPCode.SWING), prefer_function=True):
-                self._attr_swing_modes.append(SWING_ON)
+                swing_modes.append(SWING_ON)
 
             if self.find_dpcode(DPCode.SWITCH_HORIZONTAL, prefer_function=True):
-                self._attr_swing_modes.append(SWING_HORIZONTAL)
+                swing_modes.append(SWING_HORIZONTAL)
 
             if self.find_dpcode(DPCode.SWITCH_VERTICAL, prefer_function=True):
-                self._attr_swing_modes.append(SWING_VERTICAL)
+                swing_modes.append(SWING_VERTICAL)
 
         if DPCode.SWITCH in self.device.function:
-            self._attr_supported_features |= (
+            supported_features |= (
                 ClimateEntityFeature.TURN_OFF | ClimateEntityFeature.TURN_ON
             )
 
+        return TuyaClimatePlan(
+            temperature_unit=temperature_unit,
+            supported_features=supported_features,
+            current_temperature=current_temperature,
+            set_temperature=set_temperature,
+            min_temp=min_temp,
+            max_temp=max_temp,
+            target_temperature_step=target_temperature_step,
+            hvac_modes=tuple(hvac_modes),
+            hvac_to_tuya=hvac_to_tuya,
+            preset_modes=tuple(preset_modes) if preset_modes is not None else None,
+            set_humidity=set_humidity,
+            min_humidity=min_humidity,
+            max_humidity=max_humidity,
+            current_humidity=current_humidity,
+            fan_modes=tuple(fan_modes) if fan_modes is not None else None,
+            swing_modes=tuple(swing_modes) if swing_modes is not None else None,
+        )
+
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
         await super().async_added_to_hass()
@@ -366,6 +454,7 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         )
 
     @property
+    @status_cached
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
         if self._current_temperature is None:
@@ -385,6 +474,7 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         return self._current_temperature.scale_value(temperature)
 
     @property
+    @status_cached
     def current_humidity(self) -> int | None:
         """Return the current humidity."""
         if self._current_humidity is None:
@@ -397,6 +487,7 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         return round(self._current_humidity.scale_value(humidity))
 
     @property
+    @status_cached
     def target_temperature(self) -> float | None:
         """Return the temperature currently set to be reached."""
         if self._set_temperature is None:
@@ -409,6 +500,7 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         return self._set_temperature.scale_value(temperature)
 
     @property
+    @status_cached
     def target_humidity(self) -> int | None:
         """Return the humidity currently set to be reached."""
         if self._set_humidity is None:
@@ -421,6 +513,7 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         return round(self._set_humidity.scale_value(humidity))
 
     @property
+    @status_cached
     def hvac_mode(self) -> HVACMode:
         """Return hvac mode."""
         # If the switch off, hvac mode is off as well. Unless the switch
@@ -445,6 +538,7 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         return HVACMode.OFF
 
     @property
+    @status_cached
     def preset_mode(self) -> str | None:
         """Return preset mode."""
         if DPCode.MODE not in self.device.function:
@@ -462,6 +556,7 @@ class TuyaClimateEntity(TuyaEntity, ClimateEntity):
         return self.device.status.get(DPCode.FAN_SPEED_ENUM)
 
     @property
+    @status_cached
     def swing_mode(self) -> str:
         """Return swing mode."""
         if any(
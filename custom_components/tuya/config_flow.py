@@ -7,15 +7,28 @@ from typing import Any
 from tuya_sharing import LoginControl
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry, ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
 from .const import (
+    CAMERA_CATEGORIES,
+    CAMERA_STREAM_TYPES,
     CONF_ENDPOINT,
+    CONF_SAMPLE_SIZE,
+    CONF_SAMPLED_DPCODES,
+    CONF_SNAPSHOT_FPS,
+    CONF_SNAPSHOT_GRABBER,
+    CONF_STREAM_TYPE,
+    CONF_STREAM_TYPE_CAMERAS,
     CONF_TERMINAL_ID,
     CONF_TOKEN_INFO,
     CONF_USER_CODE,
+    DEFAULT_SAMPLE_SIZE,
+    DEFAULT_SAMPLED_DPCODES,
+    DEFAULT_SNAPSHOT_FPS,
+    DEFAULT_STREAM_TYPE,
     DOMAIN,
     TUYA_CLIENT_ID,
     TUYA_RESPONSE_CODE,
@@ -38,6 +51,12 @@ class TuyaConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self.__login_control = LoginControl()
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> TuyaOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return TuyaOptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -208,3 +227,104 @@ class TuyaConfigFlow(ConfigFlow, domain=DOMAIN):
             self.__user_code = user_code
             self.__qr_code = response[TUYA_RESPONSE_RESULT][TUYA_RESPONSE_QR_CODE]
         return success, response
+
+
+class TuyaOptionsFlowHandler(OptionsFlow):
+    """Tuya options flow."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        # Cameras of an entry that isn't loaded are only known by their ID
+        cameras = {
+            device_id: device_id
+            for device_id in options.get(CONF_STREAM_TYPE_CAMERAS, [])
+        }
+        entry_id = self.config_entry.entry_id
+        if hass_data := self.hass.data.get(DOMAIN, {}).get(entry_id):
+            cameras |= {
+                device.id: device.name
+                for device in hass_data.manager.device_map.values()
+                if device.category in CAMERA_CATEGORIES
+            }
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SAMPLED_DPCODES,
+                        default=options.get(
+                            CONF_SAMPLED_DPCODES, DEFAULT_SAMPLED_DPCODES
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=DEFAULT_SAMPLED_DPCODES,
+                            multiple=True,
+                            custom_value=True,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_SAMPLE_SIZE,
+                        default=options.get(CONF_SAMPLE_SIZE, DEFAULT_SAMPLE_SIZE),
+                    ): vol.All(
+                        selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=16,
+                                max=65536,
+                                mode=selector.NumberSelectorMode.BOX,
+                            )
+                        ),
+                        vol.Coerce(int),
+                    ),
+                    vol.Required(
+                        CONF_SNAPSHOT_GRABBER,
+                        default=options.get(CONF_SNAPSHOT_GRABBER, False),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_SNAPSHOT_FPS,
+                        default=options.get(CONF_SNAPSHOT_FPS, DEFAULT_SNAPSHOT_FPS),
+                    ): vol.All(
+                        selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=0.1,
+                                max=10,
+                                step=0.1,
+                                mode=selector.NumberSelectorMode.BOX,
+                            )
+                        ),
+                        vol.Coerce(float),
+                    ),
+                    vol.Required(
+                        CONF_STREAM_TYPE,
+                        default=options.get(CONF_STREAM_TYPE, DEFAULT_STREAM_TYPE),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=CAMERA_STREAM_TYPES,
+                            translation_key=CONF_STREAM_TYPE,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_STREAM_TYPE_CAMERAS,
+                        default=options.get(CONF_STREAM_TYPE_CAMERAS, []),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(value=device_id, label=name)
+                                for device_id, name in cameras.items()
+                            ],
+                            multiple=True,
+                        )
+                    ),
+                }
+            ),
+        )
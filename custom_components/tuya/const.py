@@ -1,7 +1,6 @@
 """Constants for the Tuya integration."""
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
 import logging
@@ -30,7 +29,17 @@ DOMAIN = "tuya"
 LOGGER = logging.getLogger(__package__)
 
 CONF_APP_TYPE = "tuya_app_type"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_RELATIVE = "deadband_relative"
 CONF_ENDPOINT = "endpoint"
+CONF_HEARTBEAT = "heartbeat"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_SAMPLE_SIZE = "sample_size"
+CONF_SAMPLED_DPCODES = "sampled_dpcodes"
+CONF_SNAPSHOT_FPS = "snapshot_fps"
+CONF_SNAPSHOT_GRABBER = "snapshot_grabber"
+CONF_STREAM_TYPE = "stream_type"
+CONF_STREAM_TYPE_CAMERAS = "stream_type_cameras"
 CONF_TERMINAL_ID = "terminal_id"
 CONF_TOKEN_INFO = "token_info"
 CONF_USER_CODE = "user_code"
@@ -40,8 +49,18 @@ TUYA_CLIENT_ID = "HA_3y9q4ak7g4ephrvke"
 TUYA_SCHEMA = "haauthorize"
 
 TUYA_DISCOVERY_NEW = "tuya_discovery_new"
+TUYA_HA_SIGNAL_BATTERY_SUMMARY = "tuya_battery_summary"
+TUYA_HA_SIGNAL_CAMERA_TRIGGER = "tuya_camera_trigger"
+TUYA_HA_SIGNAL_LOCK_EVENT = "tuya_lock_event"
 TUYA_HA_SIGNAL_UPDATE_ENTITY = "tuya_entry_update"
 
+SERVICE_GET_LOCK_EVENTS = "get_lock_events"
+SERVICE_GET_STATISTICS = "get_statistics"
+SERVICE_RESTORE_DEVICES = "restore_devices"
+SERVICE_SET_SENSOR_FILTER = "set_sensor_filter"
+SERVICE_SNAPSHOT_DEVICES = "snapshot_devices"
+SERVICE_TRIGGER_SCENES = "trigger_scenes"
+
 TUYA_RESPONSE_CODE = "code"
 TUYA_RESPONSE_MSG = "msg"
 TUYA_RESPONSE_QR_CODE = "qrcode"
@@ -55,6 +74,7 @@ PLATFORMS = [
     Platform.CAMERA,
     Platform.CLIMATE,
     Platform.COVER,
+    Platform.EVENT,
     Platform.FAN,
     Platform.HUMIDIFIER,
     Platform.LIGHT,
@@ -94,6 +114,7 @@ class DPCode(StrEnum):
     https://developer.tuya.com/en/docs/iot/standarddescription?id=K9i5ql6waswzq
     """
 
+    ADD_ELE = "add_ele"  # Added electricity
     AIR_QUALITY = "air_quality"
     ALARM_LOCK = "alarm_lock"
     ALARM_SWITCH = "alarm_switch"  # Alarm switch
@@ -184,6 +205,7 @@ class DPCode(StrEnum):
     DOOR_OPENED = "door_opened"
     DOOR_UNCLOSED_TRIGGER = "door_unclosed_trigger"
     DOORBELL = "doorbell"
+    DOORBELL_PIC = "doorbell_pic"
     DOORBELL_SONG = "doorbell_song"
     DOORBELL_VOLUME = "doorbell_volume"
     DOORCONTACT_STATE = "doorcontact_state"  # Status of door window sensor
@@ -445,7 +467,175 @@ class UnitOfMeasurement:
 
     aliases: set[str] = field(default_factory=set)
     conversion_unit: str | None = None
-    conversion_fn: Callable[[float], float] | None = None
+    # Power of ten a value is multiplied with, to convert it to conversion_unit
+    conversion_exponent: int = 0
+
+
+# DPs reporting the battery level as a percentage, in order of preference
+BATTERY_LEVEL_DPCODES = (
+    DPCode.BATTERY_PERCENTAGE,
+    DPCode.VA_BATTERY,
+    DPCode.RESIDUAL_ELECTRICITY,
+    DPCode.ELECTRICITY_LEFT,
+)
+BATTERY_HISTOGRAM_BUCKETS = 10
+BATTERY_LOW_THRESHOLD = 20
+
+# Smart lock categories, sharing the lock DPs
+LOCK_CATEGORIES = {
+    "bxx",
+    "gyms",
+    "hotelms",
+    "jtmsbh",
+    "jtmspro",
+    "mk",
+    "ms",
+    "ms_category",
+    "photolock",
+    "videolock",
+}
+
+# Status polling of locks, as pushed updates of sleeping locks can be missed.
+# Intervals are in seconds, the budget of requests per hour is shared by all
+# locks of an account.
+LOCK_POLL_ACTIVE_WINDOW = 600
+LOCK_POLL_BUDGET_PER_HOUR = 120
+LOCK_POLL_DEFAULT_INTERVAL = 300
+LOCK_POLL_JITTER = 0.1
+LOCK_POLL_MAX_INTERVAL = 1800
+LOCK_POLL_MIN_INTERVAL = 60
+LOCK_POLL_PATH = "/v1.0/m/life/ha/devices/detail"
+LOCK_POLL_TICK = 15
+
+# Members of locks, used to resolve the user IDs of unlocks to names.
+# Members are refreshed after the TTL, or when an unknown ID is reported
+# but no more often than the retry interval (in seconds).
+LOCK_MEMBERS_PATH = "/v1.0/m/life/devices/{device_id}/door-lock/users"
+LOCK_MEMBERS_RETRY = 900
+LOCK_MEMBERS_TTL = 24 * 3600
+
+# Number of recent unlock events kept in memory per lock
+LOCK_EVENT_HISTORY_SIZE = 50
+# Repeated reports of the same unlock DP value within this window (in
+# seconds) are considered to be a single unlock.
+LOCK_EVENT_DEDUPE_WINDOW = 5
+
+# Unlock method reported by each unlock DP, the DP value is the user ID
+LOCK_UNLOCK_METHODS: dict[str, str] = {
+    DPCode.UNLOCK_FINGERPRINT: "fingerprint",
+    DPCode.UNLOCK_PASSWORD: "password",
+    DPCode.UNLOCK_TEMPORARY: "temporary_password",
+    DPCode.UNLOCK_DYNAMIC: "dynamic_password",
+    DPCode.UNLOCK_CARD: "card",
+    DPCode.UNLOCK_IDENITY_CARD: "identity_card",
+    DPCode.UNLOCK_FACE: "face",
+    DPCode.UNLOCK_KEY: "mechanical_key",
+    DPCode.UNLOCK_EYE: "iris",
+    DPCode.UNLOCK_HAND: "palm_print",
+    DPCode.UNLOCK_FINGER_VEIN: "finger_vein",
+    DPCode.UNLOCK_BLE: "bluetooth",
+    DPCode.UNLOCK_REMOTE: "remote",
+    DPCode.UNLOCK_PHONE_REMOTE: "mobile_phone",
+    DPCode.UNLOCK_VOICE_REMOTE: "voice",
+    DPCode.UNLOCK_APP: "app",
+    DPCode.UNLOCK_ACCESS_CONTROL: "access_control_system",
+    DPCode.UNLOCK_EMERGENCY: "emergency_password",
+    DPCode.UNLOCK_ADMIN: "administrator",
+    DPCode.UNLOCK_SUBADMIN: "housekeeper",
+}
+
+
+# Alerts of locks, reported next to unlocks
+LOCK_ALERT_EVENTS: dict[str, str] = {
+    DPCode.ALARM_LOCK: "alarm",
+    DPCode.DOORBELL: "doorbell",
+    DPCode.HIJACK: "hijack",
+}
+
+# Persistent log of lock events, per config entry
+LOCK_EVENT_LOG_FLUSH_DELAY = 10
+LOCK_EVENT_LOG_MAX_SEGMENTS = 64
+LOCK_EVENT_LOG_RETENTION = 90 * 24 * 3600
+LOCK_EVENT_LOG_SEGMENT_SIZE = 1024 * 1024
+
+
+# Camera categories, shared by the camera platform and the options flow
+CAMERA_CATEGORIES = {
+    # Smart Camera (including doorbells)
+    # https://developer.tuya.com/en/docs/iot/categorysgbj?id=Kaiuz37tlpbnu
+    "sp",
+}
+
+# Stream URLs allocated for cameras are reused until shortly before they
+# expire (in seconds), URLs without an expiry are assumed to last the TTL.
+CAMERA_STREAM_URL_MARGIN = 30
+CAMERA_STREAM_URL_TTL = 300
+
+# Stream types that can be allocated for cameras, RTSP is the fallback for
+# cameras that don't support the stream type chosen in the options.
+CAMERA_STREAM_TYPES = ["rtsp", "hls", "flv", "rtmp"]
+DEFAULT_STREAM_TYPE = "hls"
+
+# Updates of these DPs prefetch the stream URL and a snapshot of a camera,
+# which is kept for the prefetch window (in seconds) instead of the cache TTL.
+CAMERA_PREFETCH_DPCODES = (
+    DPCode.ALARM_MESSAGE,
+    DPCode.DOORBELL,
+    DPCode.DOORBELL_PIC,
+    DPCode.MOVEMENT_DETECT_PIC,
+)
+CAMERA_PREFETCH_WINDOW = 30
+
+# Pictures of motion and alarm events are served as the camera image for the
+# event picture window (in seconds), instead of a snapshot of the stream.
+CAMERA_EVENT_PICTURE_DPCODES = (
+    DPCode.ALARM_MESSAGE,
+    DPCode.DOORBELL_PIC,
+    DPCode.MOVEMENT_DETECT_PIC,
+)
+CAMERA_EVENT_PICTURE_MAX_SIZE = 5 * 1024 * 1024
+CAMERA_EVENT_PICTURE_TIMEOUT = 10
+CAMERA_EVENT_PICTURE_WINDOW = 60
+
+
+# Device commands, posted directly when the response matters
+DEVICE_COMMANDS_PATH = "/v1.1/m/thing/{device_id}/commands"
+
+# Scenes of each home are refreshed periodically (in seconds), and stored so
+# they are available right away on the next start.
+SCENES_PATH = "/v1.0/m/scene/ha/home/scenes"
+SCENE_TRIGGER_PATH = "/v1.0/m/scene/ha/trigger"
+SCENE_REFRESH_INTERVAL = 15 * 60
+
+# Scenes are triggered at most a few at a time, and a scene triggered again
+# within the dedupe window (in seconds) is only triggered once.
+SCENE_TRIGGER_CONCURRENCY = 4
+SCENE_TRIGGER_DEDUPE_WINDOW = 2
+SCENE_TRIGGER_LATENCY_SAMPLES = 100
+
+# Snapshot grabbers keep decoding frames until no image was requested for the
+# idle timeout, requests wait for a frame for up to the frame timeout.
+CAMERA_SNAPSHOT_FRAME_TIMEOUT = 10
+CAMERA_SNAPSHOT_IDLE_TIMEOUT = 60
+DEFAULT_SNAPSHOT_FPS = 1.0
+
+# Snapshots are shared by requests within the cache TTL (in seconds), the
+# cache of all cameras of an entry is limited in size (in bytes).
+CAMERA_SNAPSHOT_CACHE_SIZE = 16 * 1024 * 1024
+CAMERA_SNAPSHOT_CACHE_TTL = 2
+
+
+# Numeric DPs of which recent samples are kept in memory by default
+DEFAULT_SAMPLED_DPCODES = [
+    DPCode.CUR_CURRENT,
+    DPCode.CUR_POWER,
+    DPCode.CUR_VOLTAGE,
+    DPCode.HUMIDITY_VALUE,
+    DPCode.TEMP_CURRENT,
+    DPCode.VA_HUMIDITY,
+    DPCode.VA_TEMPERATURE,
+]
+DEFAULT_SAMPLE_SIZE = 1024
 
 
 # A tuple of available units of measurements we can work with.
@@ -486,7 +676,7 @@ UNITS = (
             SensorDeviceClass.CO2,
         },
         conversion_unit=CONCENTRATION_PARTS_PER_MILLION,
-        conversion_fn=lambda x: x / 1000,
+        conversion_exponent=-3,
     ),
     UnitOfMeasurement(
         unit=UnitOfElectricCurrent.AMPERE,
@@ -498,7 +688,7 @@ UNITS = (
         aliases={"ma", "milliampere"},
         device_classes={SensorDeviceClass.CURRENT},
         conversion_unit=UnitOfElectricCurrent.AMPERE,
-        conversion_fn=lambda x: x / 1000,
+        conversion_exponent=-3,
     ),
     UnitOfMeasurement(
         unit=UnitOfEnergy.WATT_HOUR,
@@ -555,7 +745,7 @@ UNITS = (
             SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
         },
         conversion_unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        conversion_fn=lambda x: x * 1000,
+        conversion_exponent=3,
     ),
     UnitOfMeasurement(
         unit=UnitOfPower.WATT,
@@ -624,7 +814,7 @@ UNITS = (
         aliases={"mv", "millivolt"},
         device_classes={SensorDeviceClass.VOLTAGE},
         conversion_unit=UnitOfElectricPotential.VOLT,
-        conversion_fn=lambda x: x / 1000,
+        conversion_exponent=-3,
     ),
 )
 
@@ -635,3 +825,8 @@ for uom in UNITS:
         DEVICE_CLASS_UNITS.setdefault(device_class, {})[uom.unit] = uom
         for unit_alias in uom.aliases:
             DEVICE_CLASS_UNITS[device_class][unit_alias] = uom
+
+# Normalized (lower case) aliases, exact units and aliases take precedence.
+for uoms in DEVICE_CLASS_UNITS.values():
+    for unit_alias, uom in list(uoms.items()):
+        uoms.setdefault(unit_alias.lower(), uom)
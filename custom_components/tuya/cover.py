@@ -20,7 +20,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HomeAssistantTuyaData
-from .base import IntegerTypeData, TuyaEntity
+from .base import IntegerTypeData, TuyaEntity, status_cached
 from .const import DOMAIN, TUYA_DISCOVERY_NEW, DPCode, DPType
 
 
@@ -233,6 +233,7 @@ class TuyaCoverEntity(TuyaEntity, CoverEntity):
             self._tilt = int_type
 
     @property
+    @status_cached
     def current_cover_position(self) -> int | None:
         """Return cover current position."""
         if self._current_position is None:
@@ -246,6 +247,7 @@ class TuyaCoverEntity(TuyaEntity, CoverEntity):
         )
 
     @property
+    @status_cached
     def current_cover_tilt_position(self) -> int | None:
         """Return current position of cover tilt.
 
@@ -260,6 +262,7 @@ class TuyaCoverEntity(TuyaEntity, CoverEntity):
         return round(self._tilt.remap_value_to(angle, 0, 100))
 
     @property
+    @status_cached
     def is_closed(self) -> bool | None:
         """Return true if cover is closed."""
         if (
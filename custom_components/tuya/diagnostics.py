@@ -10,12 +10,17 @@ from tuya_sharing import CustomerDevice
 from homeassistant.components.diagnostics import REDACTED
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_platform,
+    entity_registry as er,
+)
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.util import dt as dt_util
 
 from . import HomeAssistantTuyaData
 from .const import DOMAIN, DPCode
+from .storage import device_memory_usage, memory_report
 
 
 async def async_get_config_entry_diagnostics(
@@ -58,12 +63,16 @@ def _async_get_diagnostics(
         data |= _async_device_as_dict(
             hass, hass_data.manager.device_map[tuya_device_id]
         )
+        if lock_events := hass_data.listener.lock_events.events(tuya_device_id):
+            data["lock_events"] = [event.as_dict() for event in lock_events]
     else:
         data.update(
             devices=[
                 _async_device_as_dict(hass, device)
                 for device in hass_data.manager.device_map.values()
-            ]
+            ],
+            memory=memory_report(hass_data.manager.device_map.values()),
+            scene_triggers=hass_data.scene_trigger.as_dict(),
         )
 
     return data
@@ -94,6 +103,7 @@ def _async_device_as_dict(
         "home_assistant": {},
         "set_up": device.set_up,
         "support_local": device.support_local,
+        "memory_bytes": device_memory_usage(device),
     }
 
     # Gather Tuya states
@@ -148,6 +158,12 @@ def _async_device_as_dict(
             include_disabled_entities=True,
         )
 
+        entities = {
+            entity_id: entity
+            for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+            for entity_id, entity in platform.entities.items()
+        }
+
         for entity_entry in hass_entities:
             state = hass.states.get(entity_entry.entity_id)
             state_dict: dict[str, Any] | None = None
@@ -175,6 +191,12 @@ def _async_device_as_dict(
                     "original_icon": entity_entry.original_icon,
                     "unit_of_measurement": entity_entry.unit_of_measurement,
                     "state": state_dict,
+                    "suppressed_writes": getattr(
+                        entities.get(entity_entry.entity_id), "suppressed_writes", None
+                    ),
+                    "stream_type": getattr(
+                        entities.get(entity_entry.entity_id), "stream_type", None
+                    ),
                 }
             )
 
@@ -0,0 +1,114 @@
+"""Support for Tuya events."""
+from __future__ import annotations
+
+from tuya_sharing import CustomerDevice, Manager
+
+from homeassistant.components.event import EventEntity, EventEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import HomeAssistantTuyaData
+from .base import TuyaEntity
+from .const import (
+    DOMAIN,
+    LOCK_CATEGORIES,
+    LOCK_UNLOCK_METHODS,
+    TUYA_DISCOVERY_NEW,
+    TUYA_HA_SIGNAL_LOCK_EVENT,
+)
+from .lock_events import LockEvent
+
+UNLOCK_EVENT_DESCRIPTION = EventEntityDescription(
+    key="unlock",
+    translation_key="unlock",
+    icon="mdi:lock-open-variant",
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up Tuya events dynamically through Tuya discovery."""
+    hass_data: HomeAssistantTuyaData = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_discover_device(device_ids: list[str]) -> None:
+        """Discover and add a discovered Tuya events."""
+        entities: list[TuyaUnlockEventEntity] = []
+        for device_id in device_ids:
+            device = hass_data.manager.device_map[device_id]
+            if device.category in LOCK_CATEGORIES and any(
+                dpcode in device.status for dpcode in LOCK_UNLOCK_METHODS
+            ):
+                entities.append(
+                    TuyaUnlockEventEntity(
+                        device, hass_data.manager, UNLOCK_EVENT_DESCRIPTION
+                    )
+                )
+
+        async_add_entities(entities)
+
+    async_discover_device([*hass_data.manager.device_map])
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, TUYA_DISCOVERY_NEW, async_discover_device)
+    )
+
+
+class TuyaUnlockEventEntity(TuyaEntity, EventEntity):
+    """Unlocks of a Tuya smart lock, with the method and user ID."""
+
+    _written_available: bool | None = None
+
+    def __init__(
+        self,
+        device: CustomerDevice,
+        device_manager: Manager,
+        description: EventEntityDescription,
+    ) -> None:
+        """Init Tuya unlock event."""
+        super().__init__(device, device_manager)
+        self.entity_description = description
+        self._attr_unique_id = f"{super().unique_id}{description.key}"
+        self._attr_event_types = [
+            method
+            for dpcode, method in LOCK_UNLOCK_METHODS.items()
+            if dpcode in device.status or dpcode in device.status_range
+        ]
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+        self._written_available = self.available
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{TUYA_HA_SIGNAL_LOCK_EVENT}_{self.device.id}",
+                self._async_handle_lock_event,
+            )
+        )
+
+    @callback
+    def _handle_status_update(self) -> None:
+        """Only write the state when the availability changed."""
+        if self.available != self._written_available:
+            self._written_available = self.available
+            self.async_write_ha_state()
+
+    @callback
+    def _async_handle_lock_event(self, event: LockEvent) -> None:
+        """Fire an event for an unlock."""
+        if event.event_type not in self.event_types:
+            return
+        self._trigger_event(
+            event.event_type,
+            {
+                "user_id": event.value,
+                "user_name": event.user_name,
+                "dp_code": event.dpcode,
+            },
+        )
+        self._written_available = self.available
+        self.async_write_ha_state()
@@ -0,0 +1,276 @@
+"""Persistent, append-only log of Tuya lock events."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from functools import partial
+import json
+import os
+import shutil
+from threading import Lock
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import (
+    DOMAIN,
+    LOCK_EVENT_LOG_FLUSH_DELAY,
+    LOCK_EVENT_LOG_MAX_SEGMENTS,
+    LOCK_EVENT_LOG_RETENTION,
+    LOCK_EVENT_LOG_SEGMENT_SIZE,
+    LOGGER,
+)
+from .lock_events import LockEvent
+
+_INDEX_FILE = "index.json"
+
+
+def _log_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Return the directory of the event log of a config entry."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}_events", entry_id)
+
+
+async def async_remove_event_log(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the event log of a config entry, with all its segments."""
+    await hass.async_add_executor_job(
+        partial(shutil.rmtree, _log_path(hass, entry_id), ignore_errors=True)
+    )
+
+
+@dataclass
+class LogSegment:
+    """Index of a single segment file of the event log."""
+
+    name: str
+    first: float
+    last: float
+    size: int = 0
+    devices: dict[str, int] = field(default_factory=dict)
+
+
+class LockEventLog:
+    """Lock events, stored on disk in rotated segments of JSON lines.
+
+    Each line holds a single event as a compact array. Segments are indexed
+    by time range and device, so queries only read the segments that can
+    contain matching events. Events are appended in batches, off the event
+    loop, and segments past the retention period are removed.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the event log."""
+        self.hass = hass
+        self.path = _log_path(hass, entry_id)
+        self._lock = Lock()
+        self._segments: list[LogSegment] = []
+        self._pending: list[LockEvent] = []
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> None:
+        """Load the segment index."""
+        await self.hass.async_add_executor_job(self._load)
+
+    def _load(self) -> None:
+        """Load the segment index, rebuilding it from the segments if needed."""
+        os.makedirs(self.path, exist_ok=True)
+        names = sorted(
+            name for name in os.listdir(self.path) if name.endswith(".jsonl")
+        )
+        segments: list[LogSegment] = []
+        try:
+            with open(os.path.join(self.path, _INDEX_FILE), encoding="utf-8") as file:
+                segments = [LogSegment(**segment) for segment in json.load(file)]
+        except (OSError, ValueError, TypeError):
+            pass
+        if [segment.name for segment in segments] != names:
+            LOGGER.debug("Rebuilding the lock event log index in %s", self.path)
+            segments = [
+                segment for name in names if (segment := self._index_segment(name))
+            ]
+        with self._lock:
+            self._segments = segments
+
+    def _index_segment(self, name: str) -> LogSegment | None:
+        """Build the index of a segment from its events."""
+        segment: LogSegment | None = None
+        with open(os.path.join(self.path, name), "rb") as file:
+            for line in file:
+                try:
+                    timestamp, device_id, *_ = json.loads(line)
+                except (ValueError, TypeError):
+                    continue
+                if segment is None:
+                    segment = LogSegment(name, timestamp, timestamp)
+                segment.last = timestamp
+                segment.devices[device_id] = segment.devices.get(device_id, 0) + 1
+            if segment is not None:
+                segment.size = file.tell()
+        return segment
+
+    def append(self, event: LockEvent) -> None:
+        """Queue an event to be written, safe to call from any thread."""
+        with self._lock:
+            self._pending.append(event)
+            if len(self._pending) > 1:
+                return
+        self.hass.add_job(self._async_schedule_flush)
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule writing the queued events."""
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self.hass, LOCK_EVENT_LOG_FLUSH_DELAY, self._async_flush_later
+            )
+
+    async def _async_flush_later(self, _now: Any) -> None:
+        """Write the queued events, after the flush delay."""
+        self._cancel_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the queued events."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        await self.hass.async_add_executor_job(self._flush)
+
+    def _flush(self) -> None:
+        """Write the queued events to the current segment."""
+        with self._lock:
+            events, self._pending = self._pending, []
+            if not events:
+                return
+
+            segment = self._segments[-1] if self._segments else None
+            if segment is None or segment.size >= LOCK_EVENT_LOG_SEGMENT_SIZE:
+                first = events[0].timestamp
+                segment = LogSegment(f"{int(first * 1000):015d}.jsonl", first, first)
+                self._segments.append(segment)
+
+            lines = []
+            for event in events:
+                lines.append(
+                    json.dumps(
+                        [
+                            event.timestamp,
+                            event.device_id,
+                            event.event_type,
+                            event.dpcode,
+                            event.value,
+                            event.user_name,
+                        ],
+                        separators=(",", ":"),
+                    )
+                )
+                segment.last = event.timestamp
+                segment.devices[event.device_id] = (
+                    segment.devices.get(event.device_id, 0) + 1
+                )
+            data = ("\n".join(lines) + "\n").encode()
+            try:
+                with open(os.path.join(self.path, segment.name), "ab") as file:
+                    file.write(data)
+                segment.size += len(data)
+                self._apply_retention()
+                self._write_index()
+            except OSError as err:
+                LOGGER.error("Unable to write the lock event log: %s", err)
+
+    def _apply_retention(self) -> None:
+        """Remove segments past the retention period or segment limit."""
+        cutoff = time.time() - LOCK_EVENT_LOG_RETENTION
+        while len(self._segments) > 1 and (
+            len(self._segments) > LOCK_EVENT_LOG_MAX_SEGMENTS
+            or self._segments[0].last < cutoff
+        ):
+            segment = self._segments.pop(0)
+            try:
+                os.remove(os.path.join(self.path, segment.name))
+            except FileNotFoundError:
+                pass
+
+    def _write_index(self) -> None:
+        """Write the segment index, replacing the previous one atomically."""
+        path = os.path.join(self.path, _INDEX_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump([asdict(segment) for segment in self._segments], file)
+        os.replace(f"{path}.tmp", path)
+
+    async def async_query(
+        self,
+        device_ids: set[str] | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Return logged events, newest first, and the cursor of the next page."""
+        await self.async_flush()
+        return await self.hass.async_add_executor_job(
+            self._query, device_ids, start, end, limit, cursor
+        )
+
+    def _query(
+        self,
+        device_ids: set[str] | None,
+        start: float | None,
+        end: float | None,
+        limit: int,
+        cursor: str | None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Scan the segments that may hold matching events, newest first."""
+        cursor_name, cursor_line = None, None
+        if cursor:
+            cursor_name, _, line = cursor.partition(":")
+            cursor_line = int(line) if line.isdigit() else None
+
+        with self._lock:
+            segments = [
+                segment
+                for segment in reversed(self._segments)
+                if (cursor_name is None or segment.name <= cursor_name)
+                and (start is None or segment.last >= start)
+                and (end is None or segment.first <= end)
+                and (device_ids is None or not device_ids.isdisjoint(segment.devices))
+            ]
+
+        events: list[dict[str, Any]] = []
+        for segment in segments:
+            try:
+                with open(os.path.join(self.path, segment.name), "rb") as file:
+                    lines = file.read().splitlines()
+            except FileNotFoundError:
+                continue
+            index = len(lines)
+            if segment.name == cursor_name and cursor_line is not None:
+                index = min(index, cursor_line)
+            while index > 0:
+                index -= 1
+                try:
+                    timestamp, device_id, event_type, dpcode, value, *extra = (
+                        json.loads(lines[index])
+                    )
+                except (ValueError, TypeError):
+                    continue
+                if (
+                    (device_ids is not None and device_id not in device_ids)
+                    or (start is not None and timestamp < start)
+                    or (end is not None and timestamp > end)
+                ):
+                    continue
+                if len(events) == limit:
+                    return events, f"{segment.name}:{index + 1}"
+                events.append(
+                    {
+                        "device_id": device_id,
+                        "event_type": event_type,
+                        "dp_code": dpcode,
+                        "value": value,
+                        "user_name": extra[0] if extra else None,
+                        "timestamp": timestamp,
+                    }
+                )
+        return events, None
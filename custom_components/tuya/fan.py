@@ -21,7 +21,7 @@ from homeassistant.util.percentage import (
 )
 
 from . import HomeAssistantTuyaData
-from .base import EnumTypeData, IntegerTypeData, TuyaEntity
+from .base import EnumTypeData, IntegerTypeData, TuyaEntity, status_cached
 from .const import DOMAIN, TUYA_DISCOVERY_NEW, DPCode, DPType
 
 TUYA_SUPPORT_TYPE = {
@@ -209,6 +209,7 @@ class TuyaFanEntity(TuyaEntity, FanEntity):
         return self.device.status.get(self._switch)
 
     @property
+    @status_cached
     def current_direction(self) -> str | None:
         """Return the current direction of the fan."""
         if (
@@ -240,6 +241,7 @@ class TuyaFanEntity(TuyaEntity, FanEntity):
         return self.device.status.get(self._presets.dpcode)
 
     @property
+    @status_cached
     def percentage(self) -> int | None:
         """Return the current speed."""
         if self._speed is not None:
@@ -0,0 +1,182 @@
+"""In-memory history of recent numeric Tuya DP samples."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+import json
+import math
+from threading import Lock
+import time
+from typing import Any
+
+from tuya_sharing import CustomerDevice
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class SampleRingBuffer:
+    """Fixed size ring buffer of (timestamp, value) samples."""
+
+    __slots__ = ("_times", "_values", "_next", "_count")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the ring buffer."""
+        self._times = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the buffer."""
+        return self._count
+
+    @property
+    def last_value(self) -> float | None:
+        """Return the most recent value."""
+        if not self._count:
+            return None
+        return self._values[self._next - 1]
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._times)
+        self._count = min(self._count + 1, len(self._times))
+
+    def window(self, since: float) -> Sequence[float]:
+        """Return the values of all samples taken since a timestamp."""
+        size = len(self._times)
+        start = (self._next - self._count) % size
+        if np is not None:
+            times = np.roll(np.frombuffer(self._times), -start)[: self._count]
+            values = np.roll(np.frombuffer(self._values), -start)[: self._count]
+            return values[times >= since]
+        return [
+            self._values[index % size]
+            for index in range(start, start + self._count)
+            if self._times[index % size] >= since
+        ]
+
+
+def _percentile(ordered: Sequence[float], percentile: float) -> float:
+    """Return a percentile of sorted values, interpolating linearly."""
+    rank = (len(ordered) - 1) * percentile / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def window_statistics(
+    values: Sequence[float], percentiles: Iterable[float] = ()
+) -> dict[str, Any]:
+    """Return min/max/mean and percentiles of a window of values."""
+    percentiles = list(percentiles)
+    if not len(values):
+        return {"count": 0}
+    if np is not None:
+        data = np.asarray(values)
+        results = np.percentile(data, percentiles) if percentiles else ()
+        return {
+            "count": int(data.size),
+            "min": float(data.min()),
+            "max": float(data.max()),
+            "mean": float(data.mean()),
+            "percentiles": {
+                str(percentile): float(result)
+                for percentile, result in zip(percentiles, results)
+            },
+        }
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": math.fsum(ordered) / len(ordered),
+        "percentiles": {
+            str(percentile): _percentile(ordered, percentile)
+            for percentile in percentiles
+        },
+    }
+
+
+class DeviceSampleHistory:
+    """Ring buffers of recent samples of numeric DPs, per device."""
+
+    def __init__(self, dpcodes: Iterable[str], size: int) -> None:
+        """Initialize the sample history."""
+        self._lock = Lock()
+        self._buffers: dict[tuple[str, str], SampleRingBuffer] = {}
+        self._scales: dict[tuple[str, str], float] = {}
+        self.dpcodes = frozenset(dpcodes)
+        self.size = size
+
+    def configure(self, dpcodes: Iterable[str], size: int) -> None:
+        """Change the sampled DPs and the buffer size, dropping samples."""
+        with self._lock:
+            self.dpcodes = frozenset(dpcodes)
+            self.size = size
+            self._buffers.clear()
+
+    def _scale(self, device: CustomerDevice, dpcode: str) -> float:
+        """Return the divisor to scale a raw DP value with."""
+        key = (device.product_id, dpcode)
+        if (scale := self._scales.get(key)) is None:
+            scale = 1
+            if (status_range := device.status_range.get(dpcode)) is not None:
+                try:
+                    scale = 10 ** float(json.loads(status_range.values)["scale"])
+                except (ValueError, TypeError, KeyError):
+                    pass
+            self._scales[key] = scale
+        return scale
+
+    def record(
+        self, device: CustomerDevice, changed: Iterable[str] | None = None
+    ) -> None:
+        """Record the current values of the sampled DPs of a device.
+
+        Without knowing which DPs changed, a DP is only recorded when its
+        value differs from the last recorded one.
+        """
+        if not (dpcodes := self.dpcodes.intersection(device.status)):
+            return
+        if changed is not None:
+            dpcodes = dpcodes.intersection(changed)
+        now = time.time()
+        with self._lock:
+            for dpcode in dpcodes:
+                value = device.status[dpcode]
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                value = value / self._scale(device, dpcode)
+                if (buffer := self._buffers.get((device.id, dpcode))) is None:
+                    buffer = self._buffers[(device.id, dpcode)] = SampleRingBuffer(
+                        self.size
+                    )
+                elif changed is None and buffer.last_value == value:
+                    continue
+                buffer.append(now, value)
+
+    def remove(self, device_id: str) -> None:
+        """Drop the samples of a device."""
+        with self._lock:
+            for key in [key for key in self._buffers if key[0] == device_id]:
+                del self._buffers[key]
+
+    def statistics(
+        self,
+        device_id: str,
+        dpcode: str,
+        window: float,
+        percentiles: Iterable[float] = (),
+    ) -> dict[str, Any] | None:
+        """Return statistics of a DP over a trailing window in seconds."""
+        with self._lock:
+            if (buffer := self._buffers.get((device_id, dpcode))) is None:
+                return None
+            values = buffer.window(time.time() - window)
+        return window_statistics(values, percentiles)
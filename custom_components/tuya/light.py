@@ -22,7 +22,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HomeAssistantTuyaData
-from .base import IntegerTypeData, TuyaEntity
+from .base import IntegerTypeData, TuyaEntity, status_cached
 from .const import DOMAIN, TUYA_DISCOVERY_NEW, DPCode, DPType, WorkMode
 from .util import remap_value
 
@@ -379,6 +379,20 @@ LIGHTS["cz"] = LIGHTS["kg"]
 LIGHTS["pc"] = LIGHTS["kg"]
 
 
+@dataclass(frozen=True)
+class TuyaLightPlan:
+    """Light configuration resolved from a product schema."""
+
+    color_mode_dpcode: DPCode | None
+    brightness: IntegerTypeData | None
+    brightness_max: IntegerTypeData | None
+    brightness_min: IntegerTypeData | None
+    color_temp: IntegerTypeData | None
+    color_data_dpcode: DPCode | None
+    color_data_type: ColorTypeData | None
+    supported_color_modes: frozenset[ColorMode]
+
+
 @dataclass
 class ColorData:
     """Color Data."""
@@ -453,36 +467,52 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
         super().__init__(device, device_manager)
         self.entity_description = description
         self._attr_unique_id = f"{super().unique_id}{description.key}"
-        self._attr_supported_color_modes: set[ColorMode] = set()
+
+        plan = self.get_entity_plan(description, self._compile_plan)
+        self._color_mode_dpcode = plan.color_mode_dpcode
+        self._brightness = plan.brightness
+        self._brightness_max = plan.brightness_max
+        self._brightness_min = plan.brightness_min
+        self._color_temp = plan.color_temp
+        self._color_data_dpcode = plan.color_data_dpcode
+        self._color_data_type = plan.color_data_type
+        self._attr_supported_color_modes = set(plan.supported_color_modes)
+
+    def _compile_plan(self) -> TuyaLightPlan:
+        """Resolve the light configuration from the device schema."""
+        description = self.entity_description
+        supported_color_modes: set[ColorMode] = set()
+        brightness_max: IntegerTypeData | None = None
+        brightness_min: IntegerTypeData | None = None
+        color_data_dpcode: DPCode | None = None
+        color_data_type: ColorTypeData | None = None
 
         # Determine DPCodes
-        self._color_mode_dpcode = self.find_dpcode(
+        color_mode_dpcode = self.find_dpcode(
             description.color_mode, prefer_function=True
         )
 
-        if int_type := self.find_dpcode(
+        if brightness := self.find_dpcode(
             description.brightness, dptype=DPType.INTEGER, prefer_function=True
         ):
-            self._brightness = int_type
-            self._attr_supported_color_modes.add(ColorMode.BRIGHTNESS)
-            self._brightness_max = self.find_dpcode(
+            supported_color_modes.add(ColorMode.BRIGHTNESS)
+            brightness_max = self.find_dpcode(
                 description.brightness_max, dptype=DPType.INTEGER
             )
-            self._brightness_min = self.find_dpcode(
+            brightness_min = self.find_dpcode(
                 description.brightness_min, dptype=DPType.INTEGER
             )
 
-        if int_type := self.find_dpcode(
+        if color_temp := self.find_dpcode(
             description.color_temp, dptype=DPType.INTEGER, prefer_function=True
         ):
-            self._color_temp = int_type
-            self._attr_supported_color_modes.add(ColorMode.COLOR_TEMP)
+            supported_color_modes.add(ColorMode.COLOR_TEMP)
 
         if (
             dpcode := self.find_dpcode(description.color_data, prefer_function=True)
         ) and self.get_dptype(dpcode) == DPType.JSON:
-            self._color_data_dpcode = dpcode
-            self._attr_supported_color_modes.add(ColorMode.HS)
+            color_data_dpcode = dpcode
+            supported_color_modes.add(ColorMode.HS)
             if dpcode in self.device.function:
                 values = cast(str, self.device.function[dpcode].values)
             else:
@@ -490,21 +520,32 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
 
             # Fetch color data type information
             if function_data := json.loads(values):
-                self._color_data_type = ColorTypeData(
+                color_data_type = ColorTypeData(
                     h_type=IntegerTypeData(dpcode, **function_data["h"]),
                     s_type=IntegerTypeData(dpcode, **function_data["s"]),
                     v_type=IntegerTypeData(dpcode, **function_data["v"]),
                 )
             else:
                 # If no type is found, use a default one
-                self._color_data_type = self.entity_description.default_color_type
-                if self._color_data_dpcode == DPCode.COLOUR_DATA_V2 or (
-                    self._brightness and self._brightness.max > 255
+                color_data_type = description.default_color_type
+                if color_data_dpcode == DPCode.COLOUR_DATA_V2 or (
+                    brightness and brightness.max > 255
                 ):
-                    self._color_data_type = DEFAULT_COLOR_TYPE_DATA_V2
-
-        if not self._attr_supported_color_modes:
-            self._attr_supported_color_modes = {ColorMode.ONOFF}
+                    color_data_type = DEFAULT_COLOR_TYPE_DATA_V2
+
+        if not supported_color_modes:
+            supported_color_modes = {ColorMode.ONOFF}
+
+        return TuyaLightPlan(
+            color_mode_dpcode=color_mode_dpcode,
+            brightness=brightness,
+            brightness_max=brightness_max,
+            brightness_min=brightness_min,
+            color_temp=color_temp,
+            color_data_dpcode=color_data_dpcode,
+            color_data_type=color_data_type,
+            supported_color_modes=frozenset(supported_color_modes),
+        )
 
     @property
     def is_on(self) -> bool:
@@ -631,6 +672,7 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
         self._send_command([{"code": self.entity_description.key, "value": False}])
 
     @property
+    @status_cached
     def brightness(self) -> int | None:
         """Return the brightness of the light."""
         # If the light is currently in color mode, extract the brightness from the color data
@@ -671,6 +713,7 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
         return round(brightness)
 
     @property
+    @status_cached
     def color_temp(self) -> int | None:
         """Return the color_temp of the light."""
         if not self._color_temp:
@@ -687,6 +730,7 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
         )
 
     @property
+    @status_cached
     def hs_color(self) -> tuple[float, float] | None:
         """Return the hs_color of the light."""
         if self._color_data_dpcode is None or not (
@@ -696,6 +740,7 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
         return color_data.hs_color
 
     @property
+    @status_cached
     def color_mode(self) -> ColorMode:
         """Return the color_mode of the light."""
         # We consider it to be in HS color mode, when work mode is anything
@@ -711,6 +756,7 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
             return ColorMode.BRIGHTNESS
         return ColorMode.ONOFF
 
+    @status_cached
     def _get_color_data(self) -> ColorData | None:
         """Get current color data from device."""
         if (
@@ -0,0 +1,138 @@
+"""Detection of unlock and alert events reported by Tuya smart locks."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from threading import Lock
+import time
+from typing import Any
+
+from tuya_sharing import CustomerDevice
+
+from .const import (
+    LOCK_ALERT_EVENTS,
+    LOCK_EVENT_DEDUPE_WINDOW,
+    LOCK_EVENT_HISTORY_SIZE,
+    LOCK_UNLOCK_METHODS,
+)
+
+# Event type of each DP that reports lock events
+_EVENT_TYPES = {**LOCK_UNLOCK_METHODS, **LOCK_ALERT_EVENTS}
+
+
+@dataclass(frozen=True)
+class LockEvent:
+    """A single unlock or alert of a smart lock.
+
+    For unlocks, the event type is the unlock method and the value the ID
+    of the user or credential that unlocked, resolved to a name if known.
+    """
+
+    device_id: str
+    dpcode: str
+    event_type: str
+    value: Any
+    timestamp: float
+    user_name: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the event as a dictionary."""
+        return {
+            "dp_code": self.dpcode,
+            "event_type": self.event_type,
+            "value": self.value,
+            "timestamp": self.timestamp,
+            "user_name": self.user_name,
+        }
+
+
+class LockEventTracker:
+    """Turns lock DP reports into deduplicated lock events, per lock."""
+
+    def __init__(
+        self,
+        resolve: Callable[[str, str, Any], str | None] | None = None,
+        size: int = LOCK_EVENT_HISTORY_SIZE,
+    ) -> None:
+        """Initialize the tracker, optionally resolving unlock values to names."""
+        self._resolve = resolve
+        self._lock = Lock()
+        self._size = size
+        self._events: dict[str, deque[LockEvent]] = {}
+        self._last_reports: dict[tuple[str, str], tuple[Any, float]] = {}
+
+    def seed(self, device: CustomerDevice) -> None:
+        """Record the current values of a lock, which are not events."""
+        with self._lock:
+            for dpcode in _EVENT_TYPES.keys() & device.status.keys():
+                # Not a report, the dedupe window doesn't apply to it
+                self._last_reports.setdefault(
+                    (device.id, dpcode), (device.status[dpcode], 0.0)
+                )
+
+    def process(
+        self, device: CustomerDevice, changed: Iterable[str] | None = None
+    ) -> list[LockEvent]:
+        """Return the lock events in a status update of a device.
+
+        Each report of a DP is an event, unless the same value was reported
+        within the dedupe window. Without knowing which DPs were reported, a
+        DP is only considered reported when its value changed.
+        """
+        dpcodes = _EVENT_TYPES.keys() & (device.status if changed is None else changed)
+        if not dpcodes:
+            return []
+
+        events: list[LockEvent] = []
+        now = time.time()
+        with self._lock:
+            for dpcode in dpcodes:
+                if (value := device.status.get(dpcode)) is None:
+                    continue
+                key = (device.id, dpcode)
+                last_report = self._last_reports.get(key)
+                self._last_reports[key] = (value, now)
+                # Cleared alerts are not events, but are recorded so the next
+                # alert is a change
+                if value is False:
+                    continue
+                if changed is None:
+                    if last_report is not None and last_report[0] == value:
+                        continue
+                elif (
+                    last_report is not None
+                    and last_report[0] == value
+                    and now - last_report[1] < LOCK_EVENT_DEDUPE_WINDOW
+                ):
+                    continue
+
+                event = LockEvent(
+                    device_id=device.id,
+                    dpcode=dpcode,
+                    event_type=_EVENT_TYPES[dpcode],
+                    value=value,
+                    timestamp=now,
+                    user_name=(
+                        self._resolve(device.id, dpcode, value)
+                        if self._resolve is not None and dpcode in LOCK_UNLOCK_METHODS
+                        else None
+                    ),
+                )
+                if (history := self._events.get(device.id)) is None:
+                    history = self._events[device.id] = deque(maxlen=self._size)
+                history.append(event)
+                events.append(event)
+        return events
+
+    def events(self, device_id: str) -> list[LockEvent]:
+        """Return the recent events of a lock, oldest first."""
+        with self._lock:
+            return list(self._events.get(device_id, ()))
+
+    def remove(self, device_id: str) -> None:
+        """Drop the events of a lock."""
+        with self._lock:
+            self._events.pop(device_id, None)
+            for key in [key for key in self._last_reports if key[0] == device_id]:
+                del self._last_reports[key]
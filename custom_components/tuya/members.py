@@ -0,0 +1,182 @@
+"""Cached directory of the members and credentials of Tuya smart locks."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+import time
+from typing import Any
+
+from tuya_sharing import Manager
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    LOCK_CATEGORIES,
+    LOCK_MEMBERS_PATH,
+    LOCK_MEMBERS_RETRY,
+    LOCK_MEMBERS_TTL,
+    LOGGER,
+)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Key prefix of user IDs in the resolve index, as opposed to DP codes
+_USER = "user"
+
+
+def _storage_key(entry_id: str) -> str:
+    """Return the storage key of the lock members of a config entry."""
+    return f"{DOMAIN}.lock_members.{entry_id}"
+
+
+async def async_remove_lock_members(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored lock members of a config entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
+
+
+def parse_members(result: Any) -> list[dict[str, Any]]:
+    """Return the members and their credentials from a lock users response."""
+    if isinstance(result, Mapping):
+        result = result.get("list") or result.get("users") or []
+    members = []
+    for user in result if isinstance(result, list) else []:
+        if not isinstance(user, Mapping):
+            continue
+        credentials = [
+            [detail["dp_code"], str(unlock["unlock_sn"])]
+            for detail in user.get("unlock_detail") or ()
+            if isinstance(detail, Mapping) and "dp_code" in detail
+            for unlock in detail.get("unlock_list") or ()
+            if isinstance(unlock, Mapping) and "unlock_sn" in unlock
+        ]
+        members.append(
+            {
+                "user_id": str(user.get("lock_user_id", user.get("user_id", ""))),
+                "name": user.get("nick_name") or user.get("user_name"),
+                "credentials": credentials,
+            }
+        )
+    return members
+
+
+class LockMemberDirectory:
+    """Members of locks, fetched once and cached on disk with a TTL.
+
+    Unlock DP values are resolved to member names locally, an unknown value
+    triggers a refresh of the members of that lock at most every few
+    minutes.
+    """
+
+    def __init__(self, hass: HomeAssistant, manager: Manager, entry_id: str) -> None:
+        """Initialize the member directory."""
+        self.hass = hass
+        self.manager = manager
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, _storage_key(entry_id)
+        )
+        self._locks: dict[str, dict[str, Any]] = {}
+        self._index: dict[str, dict[tuple[str, str], str]] = {}
+        self._attempts: dict[str, float] = {}
+
+    async def async_load(self) -> None:
+        """Load the cached members."""
+        self._locks = await self._store.async_load() or {}
+        for device_id in self._locks:
+            self._build_index(device_id)
+
+    def _build_index(self, device_id: str) -> None:
+        """Index the credentials and user IDs of the members of a lock."""
+        index: dict[tuple[str, str], str] = {}
+        for member in self._locks[device_id]["members"]:
+            if not (name := member["name"]):
+                continue
+            if member["user_id"]:
+                index[(_USER, member["user_id"])] = name
+            for dpcode, credential in member["credentials"]:
+                index[(dpcode, credential)] = name
+        # Swapped as a whole, resolving may happen from other threads
+        self._index[device_id] = index
+
+    def resolve(self, device_id: str, dpcode: str, value: Any) -> str | None:
+        """Return the name of the member an unlock DP value belongs to.
+
+        Safe to call from any thread.
+        """
+        index = self._index.get(device_id, {})
+        if (name := index.get((dpcode, str(value)))) is None and (
+            name := index.get((_USER, str(value)))
+        ) is None:
+            self.hass.add_job(self.async_refresh, device_id, LOCK_MEMBERS_RETRY)
+        return name
+
+    @callback
+    def async_start(self, entry: ConfigEntry) -> None:
+        """Refresh expired members in the background, now and periodically."""
+
+        @callback
+        def _async_refresh_stale(*_: Any) -> None:
+            entry.async_create_background_task(
+                self.hass, self.async_refresh_stale(), "tuya lock members refresh"
+            )
+
+        _async_refresh_stale()
+        entry.async_on_unload(
+            async_track_time_interval(
+                self.hass,
+                _async_refresh_stale,
+                timedelta(seconds=LOCK_MEMBERS_TTL / 4),
+            )
+        )
+
+    async def async_refresh(self, device_id: str, max_age: float) -> None:
+        """Refresh the members of a lock if older than a maximum age."""
+        now = time.time()
+        if (
+            max(
+                self._locks.get(device_id, {}).get("fetched", 0),
+                self._attempts.get(device_id, 0),
+            )
+            > now - max_age
+        ):
+            return
+        self._attempts[device_id] = now
+
+        try:
+            response = await self.hass.async_add_executor_job(
+                self.manager.customer_api.get,
+                LOCK_MEMBERS_PATH.format(device_id=device_id),
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.debug("Fetching the members of lock %s failed: %s", device_id, exc)
+            return
+        if not response or not response.get("success"):
+            LOGGER.debug(
+                "Fetching the members of lock %s failed: %s", device_id, response
+            )
+            return
+
+        self._locks[device_id] = {
+            "fetched": now,
+            "members": parse_members(response.get("result")),
+        }
+        self._build_index(device_id)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_refresh_stale(self) -> None:
+        """Refresh the members of all locks with expired members, one by one."""
+        for device_id in list(self._locks.keys() - self.manager.device_map.keys()):
+            del self._locks[device_id]
+            self._index.pop(device_id, None)
+        for device_id, device in list(self.manager.device_map.items()):
+            if device.category in LOCK_CATEGORIES:
+                await self.async_refresh(device_id, LOCK_MEMBERS_TTL)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the members to store."""
+        return self._locks
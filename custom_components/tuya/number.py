@@ -17,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import HomeAssistantTuyaData
 from .base import IntegerTypeData, TuyaEntity
 from .const import DEVICE_CLASS_UNITS, DOMAIN, TUYA_DISCOVERY_NEW, DPCode, DPType
+from .util import get_unit_of_measurement
 
 # All descriptions can be found here. Mostly the Integer data types in the
 # default instructions set of each category end up being a number.
@@ -420,9 +421,8 @@ class TuyaNumberEntity(TuyaEntity, NumberEntity):
                 self._attr_device_class = None
                 return
 
-            uoms = DEVICE_CLASS_UNITS[self.device_class]
-            self._uom = uoms.get(self.native_unit_of_measurement) or uoms.get(
-                self.native_unit_of_measurement.lower()
+            self._uom = get_unit_of_measurement(
+                self.device_class, self.native_unit_of_measurement
             )
 
             # Unknown unit of measurement, device class should not be used.
@@ -0,0 +1,220 @@
+"""Adaptive status polling of Tuya smart locks."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from tuya_sharing import CustomerDevice, Manager
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    LOCK_CATEGORIES,
+    LOCK_POLL_ACTIVE_WINDOW,
+    LOCK_POLL_BUDGET_PER_HOUR,
+    LOCK_POLL_DEFAULT_INTERVAL,
+    LOCK_POLL_JITTER,
+    LOCK_POLL_MAX_INTERVAL,
+    LOCK_POLL_MIN_INTERVAL,
+    LOCK_POLL_PATH,
+    LOCK_POLL_TICK,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from . import DeviceListener
+
+# Number of locks fetched with a single request
+LOCK_POLL_BATCH_SIZE = 20
+
+
+@dataclass
+class LockPollState:
+    """Polling state of a single lock."""
+
+    interval: float = LOCK_POLL_DEFAULT_INTERVAL
+    next_poll: float = 0.0
+    failures: int = 0
+    status_version: int = 0
+    last_activity: float | None = None
+
+
+class LockStatusPoller:
+    """Polls the status of locks, adapting to activity and missed updates.
+
+    Locks are polled more often while active or when a poll found updates
+    that were not pushed, and less often while polls find nothing new. All
+    polls share a request budget, failing requests back off exponentially.
+    Each request fetches only the status of a batch of locks, unlike the SDK
+    device queries that also fetch the specification of each device.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, manager: Manager, listener: DeviceListener
+    ) -> None:
+        """Initialize the poller."""
+        self.hass = hass
+        self.manager = manager
+        self.listener = listener
+        self.states: dict[str, LockPollState] = {}
+        self._capacity = LOCK_POLL_BUDGET_PER_HOUR / 12
+        self._tokens = self._capacity
+        self._refilled = time.monotonic()
+        self._polling = False
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start polling."""
+        self._unsub = async_track_time_interval(
+            self.hass, self._async_tick, timedelta(seconds=LOCK_POLL_TICK)
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @staticmethod
+    def _schedule(state: LockPollState, now: float, interval: float) -> None:
+        """Schedule the next poll of a lock, with jitter."""
+        state.interval = interval
+        state.next_poll = now + interval * random.uniform(
+            1 - LOCK_POLL_JITTER, 1 + LOCK_POLL_JITTER
+        )
+
+    def _get_state(self, device_id: str, now: float) -> LockPollState:
+        """Return the polling state of a lock, spreading out first polls."""
+        if (state := self.states.get(device_id)) is None:
+            state = self.states[device_id] = LockPollState(
+                next_poll=now + random.uniform(0, LOCK_POLL_DEFAULT_INTERVAL),
+                status_version=self.listener.get_status_version(device_id).version,
+            )
+        return state
+
+    async def _async_tick(self, _now: datetime) -> None:
+        """Poll the locks that are due, within the request budget."""
+        if self._polling:
+            return
+
+        now = time.monotonic()
+        refill = (now - self._refilled) * LOCK_POLL_BUDGET_PER_HOUR / 3600
+        self._tokens = min(self._capacity, self._tokens + refill)
+        self._refilled = now
+
+        for device_id in self.states.keys() - self.manager.device_map.keys():
+            del self.states[device_id]
+
+        due: list[tuple[float, str]] = []
+        for device_id, device in self.manager.device_map.items():
+            if device.category not in LOCK_CATEGORIES:
+                continue
+            state = self._get_state(device_id, now)
+
+            # Pushed updates mean the lock is active, keep a close eye on it
+            version = self.listener.get_status_version(device_id).version
+            if version != state.status_version:
+                state.status_version = version
+                state.last_activity = now
+                if state.next_poll > now + LOCK_POLL_MIN_INTERVAL:
+                    self._schedule(state, now, LOCK_POLL_MIN_INTERVAL)
+
+            if state.next_poll <= now:
+                due.append((state.next_poll, device_id))
+
+        if not due:
+            return
+
+        # Most overdue locks first, the others wait for the budget to refill
+        due.sort()
+        device_ids = [device_id for _, device_id in due]
+        batches = [
+            device_ids[index : index + LOCK_POLL_BATCH_SIZE]
+            for index in range(0, len(device_ids), LOCK_POLL_BATCH_SIZE)
+        ][: int(self._tokens)]
+        if not batches:
+            return
+        self._tokens -= len(batches)
+
+        self._polling = True
+        try:
+            await self.hass.async_add_executor_job(self._poll, batches)
+        finally:
+            self._polling = False
+
+    def _query(self, device_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch the status of a batch of devices, in a single request."""
+        response = self.manager.customer_api.get(
+            LOCK_POLL_PATH, {"devIds": ",".join(device_ids)}
+        )
+        if not response or not response.get("success"):
+            raise ValueError(response)
+        return {item["id"]: item for item in response.get("result") or ()}
+
+    def _poll(self, batches: list[list[str]]) -> None:
+        """Fetch the status of batches of locks and apply it."""
+        for device_ids in batches:
+            now = time.monotonic()
+            try:
+                fetched = self._query(device_ids)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.debug("Polling the status of %s failed: %s", device_ids, exc)
+                for device_id in device_ids:
+                    state = self.states[device_id]
+                    state.failures += 1
+                    state.next_poll = now + min(
+                        state.interval * 2**state.failures, LOCK_POLL_MAX_INTERVAL
+                    )
+                continue
+
+            for device_id in device_ids:
+                state = self.states[device_id]
+                state.failures = 0
+                missed = False
+                if (device := self.manager.device_map.get(device_id)) is not None and (
+                    fresh := fetched.get(device_id)
+                ) is not None:
+                    missed = self._apply(device, fresh)
+                    state.status_version = self.listener.get_status_version(
+                        device_id
+                    ).version
+
+                if missed or (
+                    state.last_activity is not None
+                    and now - state.last_activity < LOCK_POLL_ACTIVE_WINDOW
+                ):
+                    interval = LOCK_POLL_MIN_INTERVAL
+                else:
+                    # Nothing new, back off gradually while the lock is idle
+                    interval = min(
+                        max(state.interval, LOCK_POLL_DEFAULT_INTERVAL / 2) * 2,
+                        LOCK_POLL_MAX_INTERVAL,
+                    )
+                self._schedule(state, now, interval)
+
+    def _apply(self, device: CustomerDevice, fresh: dict[str, Any]) -> bool:
+        """Apply a fetched status to a device, return if anything was missed."""
+        status = {
+            item["code"]: item["value"]
+            for item in fresh.get("status") or ()
+            if "code" in item and "value" in item
+        }
+        changed = [
+            code for code, value in status.items() if device.status.get(code) != value
+        ]
+        for code in changed:
+            device.status[code] = status[code]
+        online = fresh.get("online", device.online)
+        online_changed = device.online != online
+        device.online = online
+
+        if changed or online_changed:
+            LOGGER.debug("Polling found missed updates of %s: %s", device.id, changed)
+            self.listener.update_device(device, None if online_changed else changed)
+        return bool(changed or online_changed)
@@ -0,0 +1,184 @@
+"""Declarative decoders for Tuya raw data points."""
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+import struct
+from typing import Literal
+
+from .const import DPCode
+
+# Struct format characters for the field sizes struct supports natively,
+# 3 byte (24 bit) fields are compiled into a byte and a short.
+_FORMATS = {1: "B", 2: "H", 4: "L"}
+
+RawPayload = str | bytes | bytearray | memoryview
+
+
+@dataclass(frozen=True)
+class RawField:
+    """Describes a field in a raw data point payload."""
+
+    name: str
+    size: Literal[1, 2, 3, 4]
+    scale: int = 0
+    signed: bool = False
+
+
+@dataclass(frozen=True)
+class RawCodec:
+    """A raw data point layout, compiled into a struct decoder."""
+
+    fields: tuple[RawField, ...]
+    byteorder: Literal[">", "<"] = ">"
+
+    _struct: struct.Struct = field(init=False, repr=False, compare=False)
+    _slots: tuple[tuple[str, int, int, int, int], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile the field layout into a struct and field slots."""
+        fmt = self.byteorder
+        slots = []
+        index = 0
+        for raw_field in self.fields:
+            if raw_field.size == 3:
+                # Big endian: high byte first, little endian: low short first.
+                fmt += "BH" if self.byteorder == ">" else "HB"
+                width = 2
+            else:
+                fmt += _FORMATS[raw_field.size]
+                width = 1
+            sign_bit = 1 << (raw_field.size * 8 - 1) if raw_field.signed else 0
+            slots.append(
+                (raw_field.name, index, width, 10**raw_field.scale, sign_bit)
+            )
+            index += width
+        object.__setattr__(self, "_struct", struct.Struct(fmt))
+        object.__setattr__(self, "_slots", tuple(slots))
+
+    @property
+    def size(self) -> int:
+        """Return the size of a single payload in bytes."""
+        return self._struct.size
+
+    def _values(self, unpacked: tuple[int, ...]) -> dict[str, float]:
+        """Convert unpacked struct values into scaled field values."""
+        values: dict[str, float] = {}
+        big_endian = self.byteorder == ">"
+        for name, index, width, divisor, sign_bit in self._slots:
+            if width == 2:
+                if big_endian:
+                    value = unpacked[index] << 16 | unpacked[index + 1]
+                else:
+                    value = unpacked[index] | unpacked[index + 1] << 16
+            else:
+                value = unpacked[index]
+            if sign_bit and value & sign_bit:
+                value -= sign_bit << 1
+            values[name] = value / divisor if divisor != 1 else value
+        return values
+
+    def decode(
+        self, payload: RawPayload, offset: int = 0
+    ) -> dict[str, float] | None:
+        """Decode a single payload, base64 strings are decoded first.
+
+        Binary payloads are parsed in place, a memoryview is never copied.
+        """
+        if isinstance(payload, str):
+            try:
+                payload = base64.b64decode(payload, validate=True)
+            except (binascii.Error, ValueError):
+                return None
+        try:
+            return self._values(self._struct.unpack_from(payload, offset))
+        except struct.error:
+            return None
+
+    def decode_many(
+        self, payloads: Iterable[RawPayload]
+    ) -> list[dict[str, float] | None]:
+        """Decode a batch of payloads."""
+        return [self.decode(payload) for payload in payloads]
+
+    def iter_decode(
+        self, buffer: bytes | bytearray | memoryview
+    ) -> Iterator[dict[str, float]]:
+        """Decode consecutive records packed into a single buffer.
+
+        Trailing bytes that don't form a complete record are ignored.
+        """
+        view = memoryview(buffer)
+        view = view[: len(view) - len(view) % self._struct.size]
+        for unpacked in self._struct.iter_unpack(view):
+            yield self._values(unpacked)
+
+
+# Phase data of electricity meters and circuit breakers.
+# https://developer.tuya.com/en/docs/iot/smart-meter?id=Kaiuz4gv6ack7
+PHASE_CODEC = RawCodec(
+    (
+        RawField("voltage", 2, scale=1),
+        RawField("electriccurrent", 3, scale=3),
+        RawField("power", 3, scale=3),
+    )
+)
+
+# Raw data point layouts, per device category and DPCode.
+RAW_CODECS: dict[tuple[str, str], RawCodec] = {}
+for category in ("dlq", "zndb"):
+    for dpcode in (DPCode.PHASE_A, DPCode.PHASE_B, DPCode.PHASE_C):
+        RAW_CODECS[(category, dpcode)] = PHASE_CODEC
+
+
+@dataclass(frozen=True)
+class PhaseSummary:
+    """Totals and imbalance over the phases of a multi-phase meter."""
+
+    total_power: float
+    total_current: float
+    current_imbalance: float | None
+    voltage_imbalance: float | None
+
+
+def _imbalance(values: list[float]) -> float | None:
+    """Return the maximum deviation from the average, as a percentage."""
+    if not (average := sum(values) / len(values)):
+        return None
+    return round(max(abs(value - average) for value in values) / average * 100, 2)
+
+
+@lru_cache(maxsize=256)
+def summarize_phases(payloads: tuple[str | bytes, ...]) -> PhaseSummary | None:
+    """Decode phase payloads and summarize them in a single pass.
+
+    Results are cached on the payloads, so all sensors of a meter share a
+    single decode for each phase update.
+    """
+    voltages: list[float] = []
+    currents: list[float] = []
+    total_power = 0.0
+    for payload in payloads:
+        if (values := PHASE_CODEC.decode(payload)) is None:
+            return None
+        voltages.append(values["voltage"])
+        currents.append(values["electriccurrent"])
+        total_power += values["power"]
+    if not voltages:
+        return None
+    return PhaseSummary(
+        total_power=round(total_power, 3),
+        total_current=round(sum(currents), 3),
+        current_imbalance=_imbalance(currents),
+        voltage_imbalance=_imbalance(voltages),
+    )
+
+
+def get_raw_codec(category: str, dpcode: str) -> RawCodec | None:
+    """Return the raw codec registered for a category and DPCode."""
+    return RAW_CODECS.get((category, dpcode))
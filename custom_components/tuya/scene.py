@@ -1,18 +1,51 @@
 """Support for Tuya scenes."""
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Any
 
 from tuya_sharing import Manager, SharingScene
 
 from homeassistant.components.scene import Scene
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 
 from . import HomeAssistantTuyaData
-from .const import DOMAIN
+from .const import DOMAIN, LOGGER, SCENE_REFRESH_INTERVAL, SCENES_PATH
+from .scene_trigger import SceneTrigger
+
+STORAGE_VERSION = 1
+
+
+def _storage_key(entry_id: str) -> str:
+    """Return the storage key of the scenes of a config entry."""
+    return f"{DOMAIN}.scenes.{entry_id}"
+
+
+async def async_remove_scenes(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored scenes of a config entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
+
+
+def query_scenes(manager: Manager) -> dict[int, list[SharingScene]]:
+    """Return the scenes of each home, leaving out homes that failed."""
+    scenes: dict[int, list[SharingScene]] = {}
+    for home in manager.user_homes:
+        response = manager.customer_api.get(SCENES_PATH, {"homeId": home.id})
+        if not response or not response.get("success"):
+            LOGGER.debug("Fetching the scenes of home %s failed: %s", home.id, response)
+            continue
+        scenes[home.id] = []
+        for item in response["result"]:
+            scene = SharingScene(**item)
+            scene.home_id = home.id
+            scenes[home.id].append(scene)
+    return scenes
 
 
 async def async_setup_entry(
@@ -20,8 +53,82 @@ async def async_setup_entry(
 ) -> None:
     """Set up Tuya scenes."""
     hass_data: HomeAssistantTuyaData = hass.data[DOMAIN][entry.entry_id]
-    scenes = await hass.async_add_executor_job(hass_data.manager.query_scenes)
-    async_add_entities(TuyaSceneEntity(hass_data.manager, scene) for scene in scenes)
+    store: Store[list[dict[str, Any]]] = Store(
+        hass, STORAGE_VERSION, _storage_key(entry.entry_id)
+    )
+    entities: dict[str, TuyaSceneEntity] = {}
+    stored = await store.async_load()
+
+    async def async_update_scenes(scenes: list[SharingScene]) -> None:
+        """Add, update and remove scene entities to match the scenes."""
+        scene_map = {scene.scene_id: scene for scene in scenes}
+        device_registry = dr.async_get(hass)
+        for scene_id in entities.keys() - scene_map.keys():
+            entity = entities.pop(scene_id)
+            if entity.hass is not None:
+                await entity.async_remove(force_remove=True)
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, f"{entity.unique_id}")}
+            ):
+                device_registry.async_remove_device(device.id)
+
+        new_entities = []
+        for scene_id, scene in scene_map.items():
+            if (entity := entities.get(scene_id)) is not None:
+                entity.async_update_scene(scene)
+            else:
+                entity = entities[scene_id] = TuyaSceneEntity(
+                    hass_data.manager, scene, hass_data.scene_trigger
+                )
+                new_entities.append(entity)
+        async_add_entities(new_entities)
+
+    async def async_refresh_scenes() -> None:
+        """Fetch the scenes, and update the scene entities."""
+        nonlocal stored
+        try:
+            homes = await hass.async_add_executor_job(query_scenes, hass_data.manager)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.debug("Fetching the scenes failed: %s", exc)
+            return
+
+        # Scenes of homes that failed to be fetched are kept, as long as the
+        # home itself still exists
+        home_ids = {home.id for home in hass_data.manager.user_homes}
+        scenes = [
+            *(
+                entity.scene
+                for entity in entities.values()
+                if entity.scene.home_id not in homes
+                and entity.scene.home_id in home_ids
+            ),
+            *(scene for home_scenes in homes.values() for scene in home_scenes),
+        ]
+        await async_update_scenes(scenes)
+        if (data := [vars(scene) for scene in scenes]) != stored:
+            stored = data
+            await store.async_save(data)
+
+    @callback
+    def _async_refresh_scenes(*_: Any) -> None:
+        entry.async_create_background_task(
+            hass, async_refresh_scenes(), "tuya scenes refresh"
+        )
+
+    # Start with the stored scenes, refreshed in the background
+    if stored is not None:
+        await async_update_scenes([SharingScene(**scene) for scene in stored])
+        _async_refresh_scenes()
+    else:
+        await async_refresh_scenes()
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            _async_refresh_scenes,
+            timedelta(seconds=SCENE_REFRESH_INTERVAL),
+        )
+    )
 
 
 class TuyaSceneEntity(Scene):
@@ -31,12 +138,18 @@ class TuyaSceneEntity(Scene):
     _attr_has_entity_name = True
     _attr_name = None
 
-    def __init__(self, home_manager: Manager, scene: SharingScene) -> None:
+    def __init__(
+        self,
+        home_manager: Manager,
+        scene: SharingScene,
+        scene_trigger: SceneTrigger,
+    ) -> None:
         """Init Tuya Scene."""
         super().__init__()
         self._attr_unique_id = f"tys{scene.scene_id}"
         self.home_manager = home_manager
         self.scene = scene
+        self.scene_trigger = scene_trigger
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -53,6 +166,21 @@ class TuyaSceneEntity(Scene):
         """Return if the scene is enabled."""
         return self.scene.enabled
 
-    def activate(self, **kwargs: Any) -> None:
+    @callback
+    def async_update_scene(self, scene: SharingScene) -> None:
+        """Update the scene, e.g. after it was renamed or disabled."""
+        previous, self.scene = self.scene, scene
+        if self.hass is None:
+            return
+        if scene.name != previous.name:
+            device_registry = dr.async_get(self.hass)
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, f"{self.unique_id}")}
+            ):
+                device_registry.async_update_device(device.id, name=scene.name)
+        if scene.enabled != previous.enabled:
+            self.async_write_ha_state()
+
+    async def async_activate(self, **kwargs: Any) -> None:
         """Activate the scene."""
-        self.home_manager.trigger_scene(self.scene.home_id, self.scene.scene_id)
+        await self.scene_trigger.async_trigger(self.scene.home_id, self.scene.scene_id)
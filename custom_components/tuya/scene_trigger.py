@@ -0,0 +1,112 @@
+"""Deduplicated triggering of Tuya scenes."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import time
+from typing import Any
+
+from tuya_sharing import Manager
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    LOGGER,
+    SCENE_TRIGGER_CONCURRENCY,
+    SCENE_TRIGGER_DEDUPE_WINDOW,
+    SCENE_TRIGGER_LATENCY_SAMPLES,
+    SCENE_TRIGGER_PATH,
+)
+
+
+class SceneTrigger:
+    """Triggers scenes in the cloud, with bounded concurrency.
+
+    A scene that is triggered while being triggered, or within the dedupe
+    window after it was triggered, is not triggered again. The latencies of
+    recent triggers are kept for the diagnostics.
+    """
+
+    def __init__(self, hass: HomeAssistant, manager: Manager) -> None:
+        """Initialize the scene trigger."""
+        self.hass = hass
+        self.manager = manager
+        self.triggered = 0
+        self.deduplicated = 0
+        self.failed = 0
+        self.latencies: deque[float] = deque(maxlen=SCENE_TRIGGER_LATENCY_SAMPLES)
+        self._semaphore = asyncio.Semaphore(SCENE_TRIGGER_CONCURRENCY)
+        self._pending: dict[str, asyncio.Task[None]] = {}
+        self._last: dict[str, float] = {}
+
+    async def async_trigger(self, home_id: int, scene_id: str) -> bool:
+        """Trigger a scene, unless it was just triggered.
+
+        Return if the trigger was deduplicated, i.e. if the scene was already
+        being triggered or was triggered within the dedupe window.
+        """
+        deduplicated = True
+        if (task := self._pending.get(scene_id)) is None:
+            last = self._last.get(scene_id)
+            if (
+                last is not None
+                and time.monotonic() - last < SCENE_TRIGGER_DEDUPE_WINDOW
+            ):
+                self.deduplicated += 1
+                return True
+            deduplicated = False
+            task = self._pending[scene_id] = self.hass.async_create_task(
+                self._async_trigger(home_id, scene_id), f"tuya scene {scene_id}"
+            )
+        else:
+            self.deduplicated += 1
+        # A cancelled caller must not cancel the trigger awaited by others
+        await asyncio.shield(task)
+        return deduplicated
+
+    async def _async_trigger(self, home_id: int, scene_id: str) -> None:
+        """Trigger a scene in the executor, measuring the latency."""
+        try:
+            async with self._semaphore:
+                start = time.monotonic()
+                try:
+                    # Posted directly, the SDK fails on a response without
+                    # a result instead of returning the error message
+                    response = await self.hass.async_add_executor_job(
+                        self.manager.customer_api.post,
+                        SCENE_TRIGGER_PATH,
+                        None,
+                        {"homeId": home_id, "sceneId": scene_id},
+                    )
+                    if not response or not response.get("success"):
+                        raise HomeAssistantError(
+                            f"Triggering scene {scene_id} failed: "
+                            f"{(response or {}).get('msg') or 'no response'}"
+                        )
+                except Exception:
+                    self.failed += 1
+                    raise
+                end = time.monotonic()
+        finally:
+            del self._pending[scene_id]
+        LOGGER.debug("Triggered scene %s in %.3f s", scene_id, end - start)
+        self.triggered += 1
+        self.latencies.append(end - start)
+        self._last[scene_id] = start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trigger counts and latencies, for the diagnostics."""
+        latencies = sorted(self.latencies)
+        return {
+            "triggered": self.triggered,
+            "deduplicated": self.deduplicated,
+            "failed": self.failed,
+            "latency": {
+                "last": self.latencies[-1],
+                "median": latencies[len(latencies) // 2],
+                "max": latencies[-1],
+            }
+            if latencies
+            else None,
+        }
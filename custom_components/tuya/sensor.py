@@ -1,12 +1,16 @@
 """Support for Tuya sensors."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+import time
+from typing import Any, cast
 
 from tuya_sharing import CustomerDevice, Manager
 from tuya_sharing.device import DeviceStatusRange
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -18,24 +22,42 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
+    UnitOfEnergy,
     UnitOfPower,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 
 from . import HomeAssistantTuyaData
-from .base import ElectricityTypeData, EnumTypeData, IntegerTypeData, TuyaEntity
+from .base import (
+    ElectricityTypeData,
+    EnumTypeData,
+    IntegerTypeData,
+    TuyaEntity,
+    status_cached,
+)
+from .battery import FleetBatteryIndex
 from .const import (
+    BATTERY_LOW_THRESHOLD,
+    CONF_DEADBAND,
+    CONF_DEADBAND_RELATIVE,
+    CONF_HEARTBEAT,
+    CONF_MIN_INTERVAL,
     DEVICE_CLASS_UNITS,
     DOMAIN,
+    LOGGER,
     TUYA_DISCOVERY_NEW,
     DPCode,
     DPType,
     UnitOfMeasurement,
 )
+from .raw import PhaseSummary, RawCodec, get_raw_codec, summarize_phases
+from .util import get_unit_of_measurement
 
 
 @dataclass(frozen=True)
@@ -45,6 +67,102 @@ class TuyaSensorEntityDescription(SensorEntityDescription):
     subkey: str | None = None
 
 
+@dataclass(frozen=True)
+class TuyaSensorPlan:
+    """Sensor configuration resolved from a product schema."""
+
+    type: DPType | None
+    type_data: IntegerTypeData | EnumTypeData | None
+    raw_codec: RawCodec | None
+    device_class: SensorDeviceClass | str | None
+    native_unit_of_measurement: str | None
+    uom: UnitOfMeasurement | None
+    # Power of ten integer values are multiplied with, folding the scale of
+    # the DP and the unit conversion into a single transform.
+    value_exponent: float
+
+
+@dataclass(frozen=True)
+class SensorWriteFilter:
+    """Limits how often a sensor writes its state.
+
+    A change within the deadband (absolute or relative to the last written
+    value) is not written, nor is a change within the minimum interval since
+    the last write; the latter is written once the interval has passed. The
+    heartbeat writes the state regardless, once it has not been written for
+    that long. Zero disables the respective limit.
+    """
+
+    deadband: float = 0
+    deadband_relative: float = 0
+    min_interval: float = 0
+    heartbeat: float = 0
+
+    def with_options(self, options: Mapping[str, Any]) -> SensorWriteFilter:
+        """Return this filter, overridden by valid entity options."""
+        overrides: dict[str, float] = {}
+        for option in (
+            CONF_DEADBAND,
+            CONF_DEADBAND_RELATIVE,
+            CONF_MIN_INTERVAL,
+            CONF_HEARTBEAT,
+        ):
+            if option not in options:
+                continue
+            try:
+                value = float(options[option])
+            except (TypeError, ValueError):
+                value = -1
+            # Invalid options keep the default, rather than failing the entity
+            if not 0 <= value < float("inf"):
+                LOGGER.warning(
+                    "Ignoring invalid sensor filter option %s: %s",
+                    option,
+                    options[option],
+                )
+                continue
+            overrides[option] = value
+        return replace(self, **overrides)
+
+    @property
+    def enabled(self) -> bool:
+        """Return if the filter limits writes at all."""
+        return bool(self.deadband or self.deadband_relative or self.min_interval)
+
+
+# Default write filters of measurement sensors, per device class. Smart plugs
+# and meters push these every few seconds, with mostly insignificant changes.
+SENSOR_WRITE_FILTERS: dict[SensorDeviceClass, SensorWriteFilter] = {
+    SensorDeviceClass.CURRENT: SensorWriteFilter(
+        deadband_relative=0.02, min_interval=10, heartbeat=300
+    ),
+    SensorDeviceClass.POWER: SensorWriteFilter(
+        deadband_relative=0.02, min_interval=10, heartbeat=300
+    ),
+    SensorDeviceClass.VOLTAGE: SensorWriteFilter(
+        deadband=1, min_interval=30, heartbeat=300
+    ),
+}
+
+
+# Energy integrated from the power reported by devices without an energy DP.
+ENERGY_SENSOR_DESCRIPTION = TuyaSensorEntityDescription(
+    key=DPCode.CUR_POWER,
+    translation_key="integrated_energy",
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    suggested_display_precision=3,
+)
+
+# Samples further apart than this are integrated holding the older power,
+# as power is pushed on change and thus stayed constant in the meantime.
+ENERGY_TRAPEZOID_MAX_GAP = 60
+
+# Minimum change of the integrated energy before its state is written.
+ENERGY_WRITE_THRESHOLD = 0.001
+
+
 # Commonly used battery sensors, that are re-used in the sensors down below.
 BATTERY_SENSORS: tuple[TuyaSensorEntityDescription, ...] = (
     TuyaSensorEntityDescription(
@@ -456,120 +574,140 @@ SENSORS: dict[str, tuple[TuyaSensorEntityDescription, ...]] = {
             icon="mdi:fingerprint",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_fingerprint",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_PASSWORD,
             icon="mdi:form-textbox-password",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_password",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_TEMPORARY,
             icon="mdi:form-textbox-password",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_temporary_password",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_DYNAMIC,
             icon="mdi:form-textbox-password",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_dynamic_password",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_CARD,
             icon="mdi:card-bulleted-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_card",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_IDENITY_CARD,
             icon="mdi:card-account-details-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_identity_card",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_FACE,
             icon="mdi:face-recognition",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_face_recognition",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_KEY,
             icon="mdi:key-chain-variant",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_mechanical_key",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_EYE,
             icon="mdi:eye-check-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_iris",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_HAND,
             icon="mdi:hand-back-left-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_palm_print",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_FINGER_VEIN,
             icon="mdi:hand-pointing-up",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_finger_vein",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_BLE,
             icon="mdi:bluetooth",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_bluetooth",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_REMOTE,
             icon="mdi:wan",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_remote",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_PHONE_REMOTE,
             icon="mdi:cellphone-key",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_mobile_phone",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_VOICE_REMOTE,
             icon="mdi:cellphone-key",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_voice",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_APP,
             icon="mdi:open-in-app",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_app",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_ACCESS_CONTROL,
             icon="mdi:account-circle-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_access_control_system",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_EMERGENCY,
             icon="mdi:car-brake-alert",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_emergency_password",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_ADMIN,
             icon="mdi:account-check-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_administrator",
+            entity_registry_enabled_default=False,
         ),
         TuyaSensorEntityDescription(
             key=DPCode.UNLOCK_SUBADMIN,
             icon="mdi:account-check-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="lock_last_housekeeper",
+            entity_registry_enabled_default=False,
         ),
         *BATTERY_SENSORS,
     ),
@@ -1264,6 +1402,114 @@ SENSORS["mk"] = SENSORS["ms"]
 SENSORS["videolock"] = SENSORS["ms"]
 SENSORS["photolock"] = SENSORS["ms"]
 
+# Totals and imbalance, computed from the phase data of multi-phase meters
+PHASE_DPCODES = (DPCode.PHASE_A, DPCode.PHASE_B, DPCode.PHASE_C)
+PHASE_SUMMARY_CATEGORIES = {"dlq", "zndb"}
+PHASE_SUMMARY_SENSORS: tuple[TuyaSensorEntityDescription, ...] = (
+    TuyaSensorEntityDescription(
+        key=DPCode.PHASE_A,
+        translation_key="total_power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        subkey="total_power",
+    ),
+    TuyaSensorEntityDescription(
+        key=DPCode.PHASE_A,
+        translation_key="total_current",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        subkey="total_current",
+    ),
+    TuyaSensorEntityDescription(
+        key=DPCode.PHASE_A,
+        translation_key="current_imbalance",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        subkey="current_imbalance",
+    ),
+    TuyaSensorEntityDescription(
+        key=DPCode.PHASE_A,
+        translation_key="voltage_imbalance",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        subkey="voltage_imbalance",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class TuyaBatterySummarySensorEntityDescription(SensorEntityDescription):
+    """Describes a summary of the batteries of all devices of an account."""
+
+    value_fn: Callable[
+        [FleetBatteryIndex, Manager], tuple[StateType, dict[str, Any]]
+    ] = lambda batteries, manager: (None, {})
+
+
+def _device_name(manager: Manager, device_id: str) -> str | None:
+    """Return the name of a Tuya device."""
+    if (device := manager.device_map.get(device_id)) is None:
+        return None
+    return device.name
+
+
+def _low_batteries(
+    batteries: FleetBatteryIndex, manager: Manager
+) -> tuple[StateType, dict[str, Any]]:
+    """Return the number and levels of batteries below the low threshold."""
+    return batteries.count_below(BATTERY_LOW_THRESHOLD), {
+        "threshold": BATTERY_LOW_THRESHOLD,
+        "devices": [
+            {"name": _device_name(manager, device_id), "level": level}
+            for level, device_id in batteries.below(BATTERY_LOW_THRESHOLD)
+        ],
+    }
+
+
+def _lowest_battery(
+    batteries: FleetBatteryIndex, manager: Manager
+) -> tuple[StateType, dict[str, Any]]:
+    """Return the lowest battery level and its device."""
+    if (lowest := batteries.lowest()) is None:
+        return None, {}
+    level, device_id = lowest
+    return level, {"device_name": _device_name(manager, device_id)}
+
+
+def _battery_histogram(
+    batteries: FleetBatteryIndex, manager: Manager
+) -> tuple[StateType, dict[str, Any]]:
+    """Return the number of batteries, with the number per level range."""
+    return len(batteries), {"histogram": batteries.histogram()}
+
+
+BATTERY_SUMMARY_SENSORS: tuple[TuyaBatterySummarySensorEntityDescription, ...] = (
+    TuyaBatterySummarySensorEntityDescription(
+        key="low_batteries",
+        translation_key="low_batteries",
+        icon="mdi:battery-alert-variant-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_low_batteries,
+    ),
+    TuyaBatterySummarySensorEntityDescription(
+        key="lowest_battery",
+        translation_key="lowest_battery",
+        device_class=SensorDeviceClass.BATTERY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_lowest_battery,
+    ),
+    TuyaBatterySummarySensorEntityDescription(
+        key="batteries",
+        translation_key="batteries",
+        icon="mdi:battery-heart-variant",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_battery_histogram,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -1274,7 +1520,7 @@ async def async_setup_entry(
     @callback
     def async_discover_device(device_ids: list[str]) -> None:
         """Discover and add a discovered Tuya sensor."""
-        entities: list[TuyaSensorEntity] = []
+        entities: list[SensorEntity] = []
         for device_id in device_ids:
             device = hass_data.manager.device_map[device_id]
             if descriptions := SENSORS.get(device.category):
@@ -1284,10 +1530,44 @@ async def async_setup_entry(
                             TuyaSensorEntity(device, hass_data.manager, description)
                         )
 
+                # Integrate power into energy, for devices that don't report it
+                if (
+                    DPCode.CUR_POWER in device.status
+                    and DPCode.ADD_ELE not in device.status
+                    and any(
+                        description.key == DPCode.CUR_POWER
+                        for description in descriptions
+                    )
+                ):
+                    entities.append(
+                        TuyaEnergySensorEntity(
+                            device, hass_data.manager, ENERGY_SENSOR_DESCRIPTION
+                        )
+                    )
+
+            # Sum the phases of multi-phase meters, only for raw phase DPs
+            # as JSON phase DPs don't decode with the raw codec
+            if device.category in PHASE_SUMMARY_CATEGORIES and all(
+                dpcode in device.status
+                and dpcode in device.status_range
+                and device.status_range[dpcode].type == DPType.RAW
+                and get_raw_codec(device.category, dpcode) is not None
+                for dpcode in PHASE_DPCODES
+            ):
+                entities.extend(
+                    TuyaPhaseSummarySensorEntity(device, hass_data.manager, description)
+                    for description in PHASE_SUMMARY_SENSORS
+                )
+
         async_add_entities(entities)
 
     async_discover_device([*hass_data.manager.device_map])
 
+    async_add_entities(
+        TuyaBatterySummarySensorEntity(entry, hass_data.manager, description)
+        for description in BATTERY_SUMMARY_SENSORS
+    )
+
     entry.async_on_unload(
         async_dispatcher_connect(hass, TUYA_DISCOVERY_NEW, async_discover_device)
     )
@@ -1301,7 +1581,15 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
     _status_range: DeviceStatusRange | None = None
     _type: DPType | None = None
     _type_data: IntegerTypeData | EnumTypeData | None = None
+    _raw_codec: RawCodec | None = None
     _uom: UnitOfMeasurement | None = None
+    _value_factor: float = 1
+    _value_divide = True
+    _write_filter: SensorWriteFilter | None = None
+    _last_written: tuple[float, StateType, bool] | None = None
+    _cancel_delayed_write: CALLBACK_TYPE | None = None
+    _last_available: bool | None = None
+    suppressed_writes = 0
 
     def __init__(
         self,
@@ -1316,56 +1604,178 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
             f"{super().unique_id}{description.key}{description.subkey or ''}"
         )
 
+        plan = self.get_entity_plan(description, self._compile_plan)
+        self._type = plan.type
+        self._type_data = plan.type_data
+        self._raw_codec = plan.raw_codec
+        self._uom = plan.uom
+        # Dividing by a power of ten is exact for values that are, where
+        # multiplying with its inverse isn't.
+        self._value_factor = 10 ** abs(plan.value_exponent)
+        self._value_divide = plan.value_exponent <= 0
+        self._attr_device_class = plan.device_class
+        self._attr_native_unit_of_measurement = plan.native_unit_of_measurement
+
+        # If we still have a device class, we should not use an icon
+        if self._uom is not None and plan.device_class:
+            self._attr_icon = None
+
+    def _compile_plan(self) -> TuyaSensorPlan:
+        """Resolve the sensor configuration from the device schema."""
+        description = self.entity_description
+        type_data: IntegerTypeData | EnumTypeData | None = None
+        raw_codec: RawCodec | None = None
+        native_unit_of_measurement = description.native_unit_of_measurement
         if int_type := self.find_dpcode(description.key, dptype=DPType.INTEGER):
-            self._type_data = int_type
-            self._type = DPType.INTEGER
+            type_data = int_type
+            dptype: DPType | None = DPType.INTEGER
             if description.native_unit_of_measurement is None:
-                self._attr_native_unit_of_measurement = int_type.unit
+                native_unit_of_measurement = int_type.unit
         elif enum_type := self.find_dpcode(
             description.key, dptype=DPType.ENUM, prefer_function=True
         ):
-            self._type_data = enum_type
-            self._type = DPType.ENUM
+            type_data = enum_type
+            dptype = DPType.ENUM
         else:
-            self._type = self.get_dptype(DPCode(description.key))
+            dptype = self.get_dptype(DPCode(description.key))
+            if dptype is DPType.RAW:
+                raw_codec = get_raw_codec(self.device.category, description.key)
 
         # Logic to ensure the set device class and API received Unit Of Measurement
         # match Home Assistants requirements.
+        device_class = description.device_class
+        uom: UnitOfMeasurement | None = None
         if (
-            self.device_class is not None
-            and not self.device_class.startswith(DOMAIN)
+            device_class is not None
+            and not device_class.startswith(DOMAIN)
             and description.native_unit_of_measurement is None
         ):
             # We cannot have a device class, if the UOM isn't set or the
             # device class cannot be found in the validation mapping.
             if (
-                self.native_unit_of_measurement is None
-                or self.device_class not in DEVICE_CLASS_UNITS
+                native_unit_of_measurement is None
+                or device_class not in DEVICE_CLASS_UNITS
             ):
-                self._attr_device_class = None
-                return
+                device_class = None
+            else:
+                uom = get_unit_of_measurement(device_class, native_unit_of_measurement)
 
-            uoms = DEVICE_CLASS_UNITS[self.device_class]
-            self._uom = uoms.get(self.native_unit_of_measurement) or uoms.get(
-                self.native_unit_of_measurement.lower()
-            )
+                # Unknown unit of measurement, device class should not be used.
+                if uom is None:
+                    device_class = None
+                else:
+                    # Found unit of measurement, use the standardized Unit
+                    # Use the target conversion unit (if set)
+                    native_unit_of_measurement = uom.conversion_unit or uom.unit
 
-            # Unknown unit of measurement, device class should not be used.
-            if self._uom is None:
-                self._attr_device_class = None
-                return
+        return TuyaSensorPlan(
+            type=dptype,
+            type_data=type_data,
+            raw_codec=raw_codec,
+            device_class=device_class,
+            native_unit_of_measurement=native_unit_of_measurement,
+            uom=uom,
+            value_exponent=(
+                (uom.conversion_exponent if uom is not None else 0)
+                - (type_data.scale if isinstance(type_data, IntegerTypeData) else 0)
+            ),
+        )
 
-            # If we still have a device class, we should not use an icon
-            if self.device_class:
-                self._attr_icon = None
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+        self._update_write_filter()
+        self.async_on_remove(self._async_cancel_delayed_write)
 
-            # Found unit of measurement, use the standardized Unit
-            # Use the target conversion unit (if set)
-            self._attr_native_unit_of_measurement = (
-                self._uom.conversion_unit or self._uom.unit
-            )
+    @callback
+    def async_registry_entry_updated(self) -> None:
+        """Run when the entity registry entry has been updated."""
+        self._update_write_filter()
+
+    @callback
+    def _update_write_filter(self) -> None:
+        """Determine the write filter from defaults and entity options."""
+        write_filter = SensorWriteFilter()
+        if (
+            self.state_class == SensorStateClass.MEASUREMENT
+            and self.device_class is not None
+            and (default := SENSOR_WRITE_FILTERS.get(self.device_class))
+        ):
+            write_filter = default
+        if self.registry_entry and (
+            options := self.registry_entry.options.get(DOMAIN)
+        ):
+            write_filter = write_filter.with_options(options)
+        self._write_filter = write_filter if write_filter.enabled else None
+
+    @callback
+    def _async_cancel_delayed_write(self) -> None:
+        """Cancel a pending delayed state write."""
+        if self._cancel_delayed_write is not None:
+            self._cancel_delayed_write()
+            self._cancel_delayed_write = None
+
+    @callback
+    def _handle_status_update(self) -> None:
+        """Write the state, when the DP of the sensor was reported."""
+        available = self.available
+        if (
+            available == self._last_available
+            and self.status_version is not None
+            and (changed := self.status_version.changed) is not None
+            and self.entity_description.key not in changed
+        ):
+            return
+        self._last_available = available
+        self._async_write_filtered_state()
+
+    @callback
+    def _async_write_filtered_state(self) -> None:
+        """Write the state, unless the write filter suppresses it."""
+        if self._write_filter is None:
+            self.async_write_ha_state()
+            return
+
+        now = time.monotonic()
+        value = self.native_value
+        available = self.available
+        if (last_written := self._last_written) is not None:
+            last_time, last_value, last_available = last_written
+            write_filter = self._write_filter
+            if (
+                available == last_available
+                and isinstance(value, (int, float))
+                and isinstance(last_value, (int, float))
+                and not (
+                    write_filter.heartbeat and now - last_time >= write_filter.heartbeat
+                )
+            ):
+                if abs(value - last_value) <= max(
+                    write_filter.deadband,
+                    write_filter.deadband_relative * abs(last_value),
+                ):
+                    self.suppressed_writes += 1
+                    return
+                if (delay := last_time + write_filter.min_interval - now) > 0:
+                    self.suppressed_writes += 1
+                    if self._cancel_delayed_write is None:
+                        self._cancel_delayed_write = async_call_later(
+                            self.hass, delay, self._async_delayed_write
+                        )
+                    return
+
+        self._async_cancel_delayed_write()
+        self._last_written = (now, value, available)
+        self.async_write_ha_state()
+
+    @callback
+    def _async_delayed_write(self, _now: Any) -> None:
+        """Write a state change that was held back by the minimum interval."""
+        self._cancel_delayed_write = None
+        self._async_write_filtered_state()
 
     @property
+    @status_cached
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
         # Only continue if data type is known
@@ -1383,12 +1793,11 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
         if value is None:
             return None
 
-        # Scale integer/float value
-        if isinstance(self._type_data, IntegerTypeData):
-            scaled_value = self._type_data.scale_value(value)
-            if self._uom and self._uom.conversion_fn is not None:
-                return self._uom.conversion_fn(scaled_value)
-            return scaled_value
+        # Scale and convert integer/float value
+        if self._type is DPType.INTEGER:
+            if self._value_divide:
+                return value / self._value_factor
+            return value * self._value_factor
 
         # Unexpected enum value
         if (
@@ -1404,11 +1813,220 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
             values = ElectricityTypeData.from_json(value)
             return getattr(values, self.entity_description.subkey)
 
+        # Get field value from a decoded raw payload.
         if self._type is DPType.RAW:
-            if self.entity_description.subkey is None:
+            if self.entity_description.subkey is None or self._raw_codec is None:
                 return None
-            values = ElectricityTypeData.from_raw(value)
-            return getattr(values, self.entity_description.subkey)
+            if (raw_values := self._raw_codec.decode(value)) is None:
+                return None
+            return raw_values.get(self.entity_description.subkey)
 
         # Valid string or enum value
         return value
+
+
+class TuyaEnergySensorEntity(TuyaEntity, RestoreSensor):
+    """Energy, integrated from the power reported by a Tuya device."""
+
+    entity_description: TuyaSensorEntityDescription
+
+    _power: IntegerTypeData | None = None
+    _power_factor: float = 1
+    _last_sample: tuple[float, float] | None = None
+    _written_energy: float | None = None
+    _written_available = True
+
+    def __init__(
+        self,
+        device: CustomerDevice,
+        device_manager: Manager,
+        description: TuyaSensorEntityDescription,
+    ) -> None:
+        """Init Tuya energy sensor."""
+        super().__init__(device, device_manager)
+        self.entity_description = description
+        self._attr_unique_id = f"{super().unique_id}{description.translation_key}"
+        self._attr_native_value = 0.0
+
+        if power := self.find_dpcode(description.key, dptype=DPType.INTEGER):
+            self._power = power
+            # Normalize the reported power to W
+            if (
+                power.unit
+                and (
+                    uom := get_unit_of_measurement(
+                        SensorDeviceClass.POWER, power.unit
+                    )
+                )
+                and uom.unit == UnitOfPower.KILO_WATT
+            ):
+                self._power_factor = 1000
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+        if (
+            last_sensor_data := await self.async_get_last_sensor_data()
+        ) is not None and isinstance(last_sensor_data.native_value, (int, float)):
+            self._attr_native_value = float(last_sensor_data.native_value)
+        self._written_energy = self._attr_native_value
+        self._integrate()
+
+    def _current_power(self) -> float | None:
+        """Return the current power in W."""
+        if (
+            self._power is None
+            or not self.device.online
+            or (value := self.device.status.get(self._power.dpcode)) is None
+        ):
+            return None
+        return self._power.scale_value(value) * self._power_factor
+
+    @callback
+    def _integrate(self) -> None:
+        """Integrate the power since the previous sample into the energy."""
+        now = time.monotonic()
+        power = self._current_power()
+        if (last_sample := self._last_sample) is not None and power is not None:
+            last_time, last_power = last_sample
+            elapsed = now - last_time
+            if elapsed <= ENERGY_TRAPEZOID_MAX_GAP:
+                watt_seconds = (last_power + power) / 2 * elapsed
+            else:
+                watt_seconds = last_power * elapsed
+            self._attr_native_value = (
+                cast(float, self._attr_native_value) + watt_seconds / 3_600_000
+            )
+
+        # Without a power reading (e.g. offline) there is nothing to integrate
+        # until the next reading.
+        self._last_sample = (now, power) if power is not None else None
+
+    @callback
+    def _handle_status_update(self) -> None:
+        """Integrate the power and write the state on significant change."""
+        self._integrate()
+        energy = cast(float, self._attr_native_value)
+        if (
+            self._written_energy is None
+            or energy - self._written_energy >= ENERGY_WRITE_THRESHOLD
+            or self.available != self._written_available
+        ):
+            self._written_energy = energy
+            self._written_available = self.available
+            self.async_write_ha_state()
+
+
+class TuyaPhaseSummarySensorEntity(TuyaEntity, SensorEntity):
+    """Total or imbalance over the phases of a multi-phase meter."""
+
+    entity_description: TuyaSensorEntityDescription
+
+    _written: tuple[StateType, bool] | None = None
+
+    def __init__(
+        self,
+        device: CustomerDevice,
+        device_manager: Manager,
+        description: TuyaSensorEntityDescription,
+    ) -> None:
+        """Init Tuya phase summary sensor."""
+        super().__init__(device, device_manager)
+        self.entity_description = description
+        self._attr_unique_id = f"{super().unique_id}phase_{description.subkey}"
+
+    @property
+    def _summary(self) -> PhaseSummary | None:
+        """Return the summary of the current phase data."""
+        payloads = tuple(self.device.status.get(dpcode) for dpcode in PHASE_DPCODES)
+        if not all(isinstance(payload, (str, bytes)) for payload in payloads):
+            return None
+        return summarize_phases(payloads)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value computed from the phases."""
+        if (summary := self._summary) is None:
+            return None
+        return getattr(summary, cast(str, self.entity_description.subkey))
+
+    @callback
+    def _handle_status_update(self) -> None:
+        """Write the state when the phase data or availability changed."""
+        available = self.available
+        if (
+            self._written is not None
+            and self._written[1] == available
+            and self.status_version is not None
+            and (changed := self.status_version.changed) is not None
+            and changed.isdisjoint(PHASE_DPCODES)
+        ):
+            return
+        value = self.native_value
+        if self._written == (value, available):
+            return
+        self._written = (value, available)
+        self.async_write_ha_state()
+
+
+class TuyaBatterySummarySensorEntity(SensorEntity):
+    """Summary of the batteries of all devices of a Tuya account."""
+
+    entity_description: TuyaBatterySummarySensorEntityDescription
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device_manager: Manager,
+        description: TuyaBatterySummarySensorEntityDescription,
+    ) -> None:
+        """Init Tuya battery summary sensor."""
+        self.entity_description = description
+        self.device_manager = device_manager
+        self._attr_unique_id = f"{entry.entry_id}{description.key}"
+        self._attr_extra_state_attributes = {}
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer="Tuya",
+            name=entry.title,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def _batteries(self) -> FleetBatteryIndex:
+        """Return the battery index of the config entry."""
+        hass_data: HomeAssistantTuyaData = self.hass.data[DOMAIN][
+            cast(ConfigEntry, self.platform.config_entry).entry_id
+        ]
+        return hass_data.listener.batteries
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        self._update_summary()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._batteries.signal, self._handle_summary_update
+            )
+        )
+
+    def _update_summary(self) -> bool:
+        """Update the value from the battery index, return if it changed."""
+        value, attributes = self.entity_description.value_fn(
+            self._batteries, self.device_manager
+        )
+        if value == self._attr_native_value and attributes == (
+            self._attr_extra_state_attributes
+        ):
+            return False
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attributes
+        return True
+
+    @callback
+    def _handle_summary_update(self) -> None:
+        """Write the state when the summary changed."""
+        if self._update_summary():
+            self.async_write_ha_state()
@@ -0,0 +1,389 @@
+"""Services for the Tuya integration."""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_ENTITY_ID, ATTR_NAME
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_platform,
+    entity_registry as er,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_RELATIVE,
+    CONF_HEARTBEAT,
+    CONF_MIN_INTERVAL,
+    DOMAIN,
+    SERVICE_GET_LOCK_EVENTS,
+    SERVICE_GET_STATISTICS,
+    SERVICE_RESTORE_DEVICES,
+    SERVICE_SET_SENSOR_FILTER,
+    SERVICE_SNAPSHOT_DEVICES,
+    SERVICE_TRIGGER_SCENES,
+)
+
+if TYPE_CHECKING:
+    from . import HomeAssistantTuyaData
+    from .scene import TuyaSceneEntity
+
+ATTR_CURSOR = "cursor"
+ATTR_DP_CODE = "dp_code"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_PERCENTILES = "percentiles"
+ATTR_STAGES = "stages"
+ATTR_START = "start"
+ATTR_STOP_ON_ERROR = "stop_on_error"
+ATTR_STORE = "store"
+ATTR_WINDOW = "window"
+
+GET_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_DP_CODE): cv.string,
+        vol.Required(ATTR_WINDOW): cv.positive_time_period,
+        vol.Optional(ATTR_PERCENTILES, default=[]): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(float), vol.Range(min=0, max=100))]
+        ),
+    }
+)
+
+GET_LOCK_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_LIMIT, default=50): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+        vol.Optional(ATTR_CURSOR): cv.string,
+    }
+)
+
+TRIGGER_SCENES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_ENTITY_ID, "scenes"): cv.entity_ids,
+            vol.Exclusive(ATTR_STAGES, "scenes"): vol.All(
+                cv.ensure_list, [cv.entity_ids]
+            ),
+            vol.Optional(ATTR_STOP_ON_ERROR, default=False): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ENTITY_ID, ATTR_STAGES),
+)
+
+SNAPSHOT_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_STORE, default=False): cv.boolean,
+    }
+)
+
+RESTORE_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SET_SENSOR_FILTER_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(CONF_DEADBAND): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_DEADBAND_RELATIVE): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional(CONF_MIN_INTERVAL): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+        vol.Optional(CONF_HEARTBEAT): vol.All(cv.time_period, cv.positive_timedelta),
+    }
+)
+
+
+def _async_get_device(hass: HomeAssistant, device_id: str) -> tuple[str, str]:
+    """Return the config entry ID and Tuya device ID for a device registry ID."""
+    if device_entry := dr.async_get(hass).async_get(device_id):
+        for domain, tuya_device_id in device_entry.identifiers:
+            if domain != DOMAIN:
+                continue
+            for entry_id in device_entry.config_entries:
+                hass_data: HomeAssistantTuyaData | None = hass.data.get(
+                    DOMAIN, {}
+                ).get(entry_id)
+                if hass_data and tuya_device_id in hass_data.manager.device_map:
+                    return entry_id, tuya_device_id
+    raise ServiceValidationError(f"Unknown Tuya device: {device_id}")
+
+
+async def _async_get_statistics(call: ServiceCall) -> ServiceResponse:
+    """Return statistics of recent samples of a device DP."""
+    entry_id, tuya_device_id = _async_get_device(call.hass, call.data[ATTR_DEVICE_ID])
+    hass_data: HomeAssistantTuyaData = call.hass.data[DOMAIN][entry_id]
+    statistics = hass_data.listener.history.statistics(
+        tuya_device_id,
+        call.data[ATTR_DP_CODE],
+        call.data[ATTR_WINDOW].total_seconds(),
+        call.data[ATTR_PERCENTILES],
+    )
+    if statistics is None:
+        raise ServiceValidationError(
+            f"No samples of {call.data[ATTR_DP_CODE]} are kept for this device"
+        )
+    return statistics
+
+
+async def _async_get_lock_events(call: ServiceCall) -> ServiceResponse:
+    """Return logged lock events, newest first, a page at a time."""
+    hass = call.hass
+    device_ids: dict[str, set[str]] | None = None
+    if ATTR_DEVICE_ID in call.data:
+        device_ids = {}
+        for device_id in call.data[ATTR_DEVICE_ID]:
+            entry_id, tuya_device_id = _async_get_device(hass, device_id)
+            device_ids.setdefault(entry_id, set()).add(tuya_device_id)
+    entry_ids = sorted(device_ids or hass.data.get(DOMAIN, {}))
+
+    # Entries are paged through one after another
+    cursor_entry_id, _, cursor = call.data.get(ATTR_CURSOR, "").partition("|")
+    if cursor_entry_id:
+        if cursor_entry_id not in entry_ids:
+            raise ServiceValidationError("Invalid cursor")
+        entry_ids = entry_ids[entry_ids.index(cursor_entry_id) :]
+
+    start = end = None
+    if ATTR_START in call.data:
+        start = dt_util.as_timestamp(call.data[ATTR_START])
+    if ATTR_END in call.data:
+        end = dt_util.as_timestamp(call.data[ATTR_END])
+    limit: int = call.data[ATTR_LIMIT]
+    device_registry = dr.async_get(hass)
+    events: list[dict[str, Any]] = []
+    next_cursor: str | None = None
+    for index, entry_id in enumerate(entry_ids):
+        if len(events) == limit:
+            next_cursor = f"{entry_id}|"
+            break
+        hass_data: HomeAssistantTuyaData = hass.data[DOMAIN][entry_id]
+        entry_events, entry_cursor = await hass_data.listener.event_log.async_query(
+            device_ids[entry_id] if device_ids is not None else None,
+            start,
+            end,
+            limit - len(events),
+            (cursor or None) if index == 0 else None,
+        )
+        for event in entry_events:
+            tuya_device_id = event.pop("device_id")
+            device_entry = device_registry.async_get_device(
+                identifiers={(DOMAIN, tuya_device_id)}
+            )
+            events.append(
+                {
+                    ATTR_DEVICE_ID: device_entry.id if device_entry else None,
+                    "device_name": (
+                        device_entry.name_by_user or device_entry.name
+                        if device_entry
+                        else None
+                    ),
+                    **event,
+                    "timestamp": dt_util.utc_from_timestamp(
+                        event["timestamp"]
+                    ).isoformat(),
+                }
+            )
+        if entry_cursor is not None:
+            next_cursor = f"{entry_id}|{entry_cursor}"
+            break
+
+    return {"events": events, "next_cursor": next_cursor}
+
+
+async def _async_trigger_scene(entity: TuyaSceneEntity) -> dict[str, Any]:
+    """Trigger a scene, return the result."""
+    result: dict[str, Any] = {
+        ATTR_ENTITY_ID: entity.entity_id,
+        "success": False,
+        "deduplicated": False,
+    }
+    if not entity.scene.enabled:
+        result["error"] = "Scene is disabled"
+        return result
+    try:
+        result["deduplicated"] = await entity.scene_trigger.async_trigger(
+            entity.scene.home_id, entity.scene.scene_id
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        result["error"] = str(exc) or type(exc).__name__
+    else:
+        result["success"] = True
+    return result
+
+
+async def _async_trigger_scenes(call: ServiceCall) -> ServiceResponse:
+    """Trigger scenes concurrently, stage by stage, return the results."""
+    stages: list[list[str]] = call.data.get(ATTR_STAGES) or [call.data[ATTR_ENTITY_ID]]
+    scenes: dict[str, TuyaSceneEntity] = {
+        entity_id: entity
+        for platform in entity_platform.async_get_platforms(call.hass, DOMAIN)
+        if platform.domain == "scene"
+        for entity_id, entity in platform.entities.items()
+    }
+    if unknown := [
+        entity_id for stage in stages for entity_id in stage if entity_id not in scenes
+    ]:
+        raise ServiceValidationError(f"Unknown Tuya scenes: {', '.join(unknown)}")
+
+    results: list[dict[str, Any]] = []
+    for index, stage in enumerate(stages):
+        # Triggers are limited in concurrency by the scene trigger of the entry
+        stage_results = await asyncio.gather(
+            *(_async_trigger_scene(scenes[entity_id]) for entity_id in stage)
+        )
+        results.extend({**result, "stage": index} for result in stage_results)
+        if call.data[ATTR_STOP_ON_ERROR] and not all(
+            result["success"] for result in stage_results
+        ):
+            break
+    return {"results": results}
+
+
+async def _async_snapshot_devices(call: ServiceCall) -> None:
+    """Take a named snapshot of the status of devices."""
+    hass = call.hass
+    device_ids: dict[str, list[str]] = {}
+    for device_id in call.data[ATTR_DEVICE_ID]:
+        entry_id, tuya_device_id = _async_get_device(hass, device_id)
+        device_ids.setdefault(entry_id, []).append(tuya_device_id)
+
+    # A snapshot replaces the previous one with the same name in all entries
+    entries: dict[str, HomeAssistantTuyaData] = hass.data.get(DOMAIN, {})
+    for entry_id, hass_data in entries.items():
+        if entry_id in device_ids:
+            hass_data.status_snapshots.async_take(
+                call.data[ATTR_NAME], device_ids[entry_id], call.data[ATTR_STORE]
+            )
+        else:
+            hass_data.status_snapshots.async_remove(call.data[ATTR_NAME])
+
+
+async def _async_restore_devices(call: ServiceCall) -> ServiceResponse:
+    """Restore a snapshot, sending only the DPs that changed since."""
+    hass = call.hass
+    name: str = call.data[ATTR_NAME]
+    device_ids: dict[str, set[str]] | None = None
+    if ATTR_DEVICE_ID in call.data:
+        device_ids = {}
+        for device_id in call.data[ATTR_DEVICE_ID]:
+            entry_id, tuya_device_id = _async_get_device(hass, device_id)
+            device_ids.setdefault(entry_id, set()).add(tuya_device_id)
+
+    entries: dict[str, HomeAssistantTuyaData] = hass.data.get(DOMAIN, {})
+    snapshots = [
+        hass_data.status_snapshots.async_restore(
+            name, device_ids.get(entry_id, set()) if device_ids is not None else None
+        )
+        for entry_id, hass_data in entries.items()
+        if name in hass_data.status_snapshots
+    ]
+    if not snapshots:
+        raise ServiceValidationError(f"Unknown snapshot: {name}")
+
+    device_registry = dr.async_get(hass)
+    results: list[dict[str, Any]] = []
+    for entry_results in await asyncio.gather(*snapshots):
+        for result in entry_results:
+            device_entry = device_registry.async_get_device(
+                identifiers={(DOMAIN, result.pop("device_id"))}
+            )
+            results.append(
+                {ATTR_DEVICE_ID: device_entry.id if device_entry else None, **result}
+            )
+    return {"results": results}
+
+
+async def _async_set_sensor_filter(call: ServiceCall) -> None:
+    """Set the write filter options of sensors, omitted options are defaults."""
+    entity_registry = er.async_get(call.hass)
+    entity_ids: list[str] = call.data[ATTR_ENTITY_ID]
+    if unknown := [
+        entity_id
+        for entity_id in entity_ids
+        if not (entry := entity_registry.async_get(entity_id))
+        or entry.platform != DOMAIN
+        or entry.domain != "sensor"
+    ]:
+        raise ServiceValidationError(f"Unknown Tuya sensors: {', '.join(unknown)}")
+
+    options: dict[str, float] = {}
+    for option in (CONF_DEADBAND, CONF_DEADBAND_RELATIVE):
+        if option in call.data:
+            options[option] = call.data[option]
+    for option in (CONF_MIN_INTERVAL, CONF_HEARTBEAT):
+        if option in call.data:
+            options[option] = call.data[option].total_seconds()
+    # The sensors pick up the options when their registry entries are updated
+    for entity_id in entity_ids:
+        entity_registry.async_update_entity_options(entity_id, DOMAIN, options)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Tuya services, once for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_STATISTICS):
+        return
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STATISTICS,
+        _async_get_statistics,
+        schema=GET_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_LOCK_EVENTS,
+        _async_get_lock_events,
+        schema=GET_LOCK_EVENTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TRIGGER_SCENES,
+        _async_trigger_scenes,
+        schema=TRIGGER_SCENES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT_DEVICES,
+        _async_snapshot_devices,
+        schema=SNAPSHOT_DEVICES_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_DEVICES,
+        _async_restore_devices,
+        schema=RESTORE_DEVICES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SENSOR_FILTER,
+        _async_set_sensor_filter,
+        schema=SET_SENSOR_FILTER_SCHEMA,
+    )
@@ -0,0 +1,331 @@
+"""Snapshot grabbers, snapshot caches and event pictures of Tuya cameras."""
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import json
+import time
+from typing import Any
+
+from homeassistant.components.camera import Image
+from homeassistant.components.camera.img_util import scale_jpeg_camera_image
+from homeassistant.components.ffmpeg import get_ffmpeg_manager
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CAMERA_SNAPSHOT_CACHE_SIZE,
+    CAMERA_SNAPSHOT_CACHE_TTL,
+    CAMERA_SNAPSHOT_FRAME_TIMEOUT,
+    CAMERA_SNAPSHOT_IDLE_TIMEOUT,
+    LOGGER,
+)
+
+_JPEG_START = b"\xff\xd8"
+_JPEG_END = b"\xff\xd9"
+_READ_SIZE = 65536
+
+
+def is_jpeg(data: bytes) -> bool:
+    """Return if data looks like a JPEG image."""
+    return data.startswith(_JPEG_START)
+
+
+def _find_url(data: Any, depth: int = 0) -> str | None:
+    """Return the first HTTP(S) URL in decoded JSON data."""
+    if isinstance(data, str):
+        return data if data.startswith(("http://", "https://")) else None
+    if isinstance(data, dict):
+        data = list(data.values())
+    if isinstance(data, list) and depth < 4:
+        for value in data:
+            if url := _find_url(value, depth + 1):
+                return url
+    return None
+
+
+def decode_event_picture(value: str) -> tuple[bytes | None, str | None]:
+    """Return the inline JPEG image or the URL held by a picture DP value.
+
+    Motion and alarm picture DPs hold a URL, a base64 encoded image or base64
+    encoded JSON referring to the picture. Pictures that are only referred to
+    by a storage bucket and path are encrypted, and not supported.
+    """
+    if value.startswith(("http://", "https://")):
+        return None, value
+    try:
+        data = base64.b64decode(value)
+    except (binascii.Error, ValueError):
+        return None, None
+    if is_jpeg(data):
+        return data, None
+    try:
+        return None, _find_url(json.loads(data))
+    except ValueError:
+        return None, None
+
+
+class SnapshotGrabber:
+    """Keeps a single RTSP session open, decoding frames while in use.
+
+    A single ffmpeg process decodes frames at a fixed rate into JPEG images,
+    of which the latest is kept. The process is started on the first request
+    and stopped when no images were requested for the idle timeout.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        get_source: Callable[[], Awaitable[str | None]],
+        fps: float,
+    ) -> None:
+        """Initialize the snapshot grabber."""
+        self.hass = hass
+        self._get_source = get_source
+        self.fps = fps
+        self.image: bytes | None = None
+        self.image_time = 0.0
+        self._last_request = 0.0
+        self._frame = asyncio.Event()
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._cancel_idle_check: CALLBACK_TYPE | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the ffmpeg process is running."""
+        return self._process is not None and self._process.returncode is None
+
+    async def async_get_image(self) -> bytes | None:
+        """Return the latest frame, waiting for a first frame if needed."""
+        now = time.monotonic()
+        self._last_request = now
+        if not self.running and not await self._async_start():
+            return None
+
+        # A frame is fresh if no newer frame should have been decoded yet
+        if self.image is not None and now - self.image_time <= 2 / self.fps:
+            return self.image
+
+        self._frame.clear()
+        try:
+            await asyncio.wait_for(self._frame.wait(), CAMERA_SNAPSHOT_FRAME_TIMEOUT)
+        except asyncio.TimeoutError:
+            LOGGER.debug("No frame received from the snapshot grabber in time")
+            return None
+        return self.image
+
+    async def _async_start(self) -> bool:
+        """Start the ffmpeg process, return if it was started."""
+        if not (source := await self._get_source()):
+            return False
+        if self.running:
+            # Started while waiting for the source
+            return True
+
+        self.image = None
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                get_ffmpeg_manager(self.hass).binary,
+                "-nostdin",
+                "-loglevel",
+                "error",
+                *(("-rtsp_transport", "tcp") if source.startswith("rtsp") else ()),
+                "-i",
+                source,
+                "-an",
+                "-vf",
+                f"fps={self.fps}",
+                "-c:v",
+                "mjpeg",
+                "-q:v",
+                "5",
+                "-f",
+                "image2pipe",
+                "pipe:1",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as err:
+            LOGGER.error("Unable to start the snapshot grabber: %s", err)
+            return False
+
+        self._reader = self.hass.async_create_background_task(
+            self._async_read_frames(self._process), "tuya camera snapshot grabber"
+        )
+        self._schedule_idle_check()
+        return True
+
+    async def _async_read_frames(self, process: asyncio.subprocess.Process) -> None:
+        """Read JPEG frames from the ffmpeg output, keeping the latest."""
+        assert process.stdout is not None
+        buffer = bytearray()
+        while chunk := await process.stdout.read(_READ_SIZE):
+            buffer += chunk
+            # Only the last complete frame in the buffer is of interest
+            if (end := buffer.rfind(_JPEG_END)) == -1:
+                continue
+            if (start := buffer.rfind(_JPEG_START, 0, end)) != -1:
+                self.image = bytes(buffer[start : end + 2])
+                self.image_time = time.monotonic()
+                self._frame.set()
+            del buffer[: end + 2]
+        await process.wait()
+        LOGGER.debug("Snapshot grabber exited with code %s", process.returncode)
+
+    @callback
+    def _schedule_idle_check(self) -> None:
+        """Check for idleness after the idle timeout."""
+        self._cancel_idle_check = async_call_later(
+            self.hass, CAMERA_SNAPSHOT_IDLE_TIMEOUT, self._async_idle_check
+        )
+
+    @callback
+    def _async_idle_check(self, _now: Any) -> None:
+        """Stop the process when no images were requested lately."""
+        self._cancel_idle_check = None
+        if not self.running:
+            return
+        if time.monotonic() - self._last_request >= CAMERA_SNAPSHOT_IDLE_TIMEOUT:
+            self.async_stop()
+        else:
+            self._schedule_idle_check()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the ffmpeg process."""
+        if self._cancel_idle_check is not None:
+            self._cancel_idle_check()
+            self._cancel_idle_check = None
+        if self.running:
+            assert self._process is not None
+            self._process.kill()
+        self._process = None
+        self.image = None
+
+
+class SnapshotCache:
+    """Recent snapshots of cameras, shared by concurrent requests.
+
+    The full size image of a camera is kept for a short time, along with the
+    resized variants requested since. Prefetched images are kept longer, for
+    the first view after an event. Concurrent requests for the same image
+    await a single fetch or resize, and the least recently used images are
+    evicted once the cache exceeds its memory limit.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ttl: float = CAMERA_SNAPSHOT_CACHE_TTL,
+        max_size: int = CAMERA_SNAPSHOT_CACHE_SIZE,
+    ) -> None:
+        """Initialize the snapshot cache."""
+        self.hass = hass
+        self.ttl = ttl
+        self.max_size = max_size
+        self.size = 0
+        self._images: OrderedDict[tuple[str, int, int], tuple[float, bytes]] = (
+            OrderedDict()
+        )
+        self._pending: dict[tuple[str, int, int], asyncio.Future[bytes | None]] = {}
+
+    async def async_get_image(
+        self,
+        device_id: str,
+        fetch: Callable[[], Awaitable[bytes | None]],
+        width: int | None = None,
+        height: int | None = None,
+    ) -> bytes | None:
+        """Return a recent image of a camera, fetching it if needed."""
+        original = (device_id, 0, 0)
+        key = (device_id, width, height) if width and height else original
+        if (image := self._get(key)) is not None:
+            return image
+
+        if (image := self._get(original)) is None:
+            image = await self._async_once(original, fetch, self.ttl)
+            if image is None or key == original:
+                return image
+
+        async def _async_resize() -> bytes | None:
+            return await self.hass.async_add_executor_job(
+                scale_jpeg_camera_image,
+                Image("image/jpeg", image),
+                width,
+                height,
+            )
+
+        # Variants expire with the image they were resized from
+        expires = self._images[original][0] if original in self._images else 0.0
+        return await self._async_once(
+            key, _async_resize, max(expires - time.monotonic(), 0.0)
+        )
+
+    async def async_prefetch(
+        self,
+        device_id: str,
+        fetch: Callable[[], Awaitable[bytes | None]],
+        ttl: float,
+    ) -> None:
+        """Fetch a new image of a camera, and keep it for the given time."""
+        self.async_invalidate(device_id)
+        await self._async_once((device_id, 0, 0), fetch, ttl)
+
+    def _get(self, key: tuple[str, int, int]) -> bytes | None:
+        """Return a cached image if it is recent enough."""
+        if (cached := self._images.get(key)) is None:
+            return None
+        if time.monotonic() > cached[0]:
+            self._remove(key)
+            return None
+        self._images.move_to_end(key)
+        return cached[1]
+
+    async def _async_once(
+        self,
+        key: tuple[str, int, int],
+        create: Callable[[], Awaitable[bytes | None]],
+        ttl: float,
+    ) -> bytes | None:
+        """Create and cache an image, sharing the result with concurrent calls."""
+        if (future := self._pending.get(key)) is None:
+
+            async def _async_create() -> bytes | None:
+                try:
+                    if (image := await create()) is not None:
+                        self._set(key, image, ttl)
+                    return image
+                finally:
+                    del self._pending[key]
+
+            future = self._pending[key] = self.hass.async_create_task(
+                _async_create(), "tuya camera snapshot"
+            )
+        # A cancelled request must not cancel the others awaiting the image
+        return await asyncio.shield(future)
+
+    def _set(self, key: tuple[str, int, int], image: bytes, ttl: float) -> None:
+        """Cache an image, evicting the least recently used images."""
+        self._remove(key)
+        if len(image) > self.max_size:
+            return
+        self._images[key] = (time.monotonic() + ttl, image)
+        self.size += len(image)
+        while self.size > self.max_size:
+            self._remove(next(iter(self._images)))
+
+    def _remove(self, key: tuple[str, int, int]) -> None:
+        """Remove an image from the cache."""
+        if (cached := self._images.pop(key, None)) is not None:
+            self.size -= len(cached[1])
+
+    @callback
+    def async_invalidate(self, device_id: str) -> None:
+        """Remove all images of a camera."""
+        for key in [key for key in self._images if key[0] == device_id]:
+            self._remove(key)
@@ -0,0 +1,137 @@
+"""Named snapshots of the status of Tuya devices, restored by difference."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from tuya_sharing import Manager
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DEVICE_COMMANDS_PATH, DOMAIN, LOGGER
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+def _storage_key(entry_id: str) -> str:
+    """Return the storage key of the status snapshots of a config entry."""
+    return f"{DOMAIN}.status_snapshots.{entry_id}"
+
+
+async def async_remove_status_snapshots(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored status snapshots of a config entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
+
+
+class DeviceStatusSnapshots:
+    """Snapshots of the writable DPs of devices, kept in memory or stored.
+
+    Restoring a snapshot compares it to the current status of the devices,
+    and sends only the DPs that differ, in a single command per device.
+    """
+
+    def __init__(self, hass: HomeAssistant, manager: Manager, entry_id: str) -> None:
+        """Initialize the snapshots."""
+        self.hass = hass
+        self.manager = manager
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, _storage_key(entry_id)
+        )
+        self._snapshots: dict[str, dict[str, dict[str, Any]]] = {}
+        self._stored: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the stored snapshots."""
+        stored = await self._store.async_load() or {}
+        self._snapshots.update(stored)
+        self._stored.update(stored)
+
+    def __contains__(self, name: str) -> bool:
+        """Return if a snapshot exists."""
+        return name in self._snapshots
+
+    @callback
+    def async_take(self, name: str, device_ids: list[str], store: bool) -> None:
+        """Take a snapshot of the writable DPs of devices."""
+        snapshot = {}
+        for device_id in device_ids:
+            device = self.manager.device_map[device_id]
+            snapshot[device_id] = {
+                dpcode: value
+                for dpcode, value in device.status.items()
+                if dpcode in device.function
+            }
+        self._snapshots[name] = snapshot
+        if store or name in self._stored:
+            if store:
+                self._stored.add(name)
+            else:
+                self._stored.discard(name)
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove(self, name: str) -> None:
+        """Remove a snapshot."""
+        self._snapshots.pop(name, None)
+        if name in self._stored:
+            self._stored.discard(name)
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_restore(
+        self, name: str, device_ids: set[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Send the DPs that differ from a snapshot, return the result per device."""
+        commands: dict[str, list[dict[str, Any]]] = {}
+        for device_id, status in self._snapshots[name].items():
+            if device_ids is not None and device_id not in device_ids:
+                continue
+            if (device := self.manager.device_map.get(device_id)) is None:
+                continue
+            commands[device_id] = [
+                {"code": dpcode, "value": value}
+                for dpcode, value in status.items()
+                if device.status.get(dpcode) != value
+            ]
+        return await asyncio.gather(
+            *(
+                self._async_send(device_id, device_commands)
+                for device_id, device_commands in commands.items()
+            )
+        )
+
+    async def _async_send(
+        self, device_id: str, commands: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Send the commands to a device, return the result."""
+        result: dict[str, Any] = {
+            "device_id": device_id,
+            "sent": [command["code"] for command in commands],
+            "success": True,
+        }
+        if not commands:
+            return result
+        LOGGER.debug("Restoring the status of device %s: %s", device_id, commands)
+        # Posted directly, Manager.send_commands ignores the response and
+        # drops commands identical to those sent shortly before
+        try:
+            response = await self.hass.async_add_executor_job(
+                self.manager.customer_api.post,
+                DEVICE_COMMANDS_PATH.format(device_id=device_id),
+                None,
+                {"commands": commands},
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            result["success"] = False
+            result["error"] = str(exc) or type(exc).__name__
+            return result
+        if not response or not response.get("success"):
+            result["success"] = False
+            result["error"] = (response or {}).get("msg") or "No response"
+        return result
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshots to store."""
+        return {name: self._snapshots[name] for name in self._stored}
@@ -0,0 +1,201 @@
+"""Compact storage of Tuya device schemas and status."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+import sys
+from typing import Any
+
+from tuya_sharing import CustomerDevice
+
+_MISSING: Any = object()
+
+
+class ProductSchema:
+    """Schema shared by all devices of a single product."""
+
+    __slots__ = ("product_id", "function", "status_range", "index", "_fingerprint")
+
+    def __init__(self, device: CustomerDevice) -> None:
+        """Intern the schema of the first device seen for a product."""
+        self.product_id: str = device.product_id
+        self.function = device.function
+        self.status_range = device.status_range
+        self._fingerprint = _schema_fingerprint(device)
+
+        # Slot index of each DP code known for this product
+        self.index: dict[str, int] = {}
+        for code in (*device.status_range, *device.function, *device.status):
+            self.index.setdefault(sys.intern(code), len(self.index))
+
+    def matches(self, device: CustomerDevice) -> bool:
+        """Return if the schema of a device is identical to this schema."""
+        return _schema_fingerprint(device) == self._fingerprint
+
+
+class CompactStatus(MutableMapping[str, Any]):
+    """Device status, stored in slots indexed by the product schema.
+
+    DP codes reported by a device that are not part of the product schema
+    are kept in an overflow dictionary.
+    """
+
+    __slots__ = ("_schema", "_values", "_extra")
+
+    def __init__(self, schema: ProductSchema, status: Mapping[str, Any]) -> None:
+        """Initialize the compact status from a status mapping."""
+        self._schema = schema
+        self._values: list[Any] = [_MISSING] * len(schema.index)
+        self._extra: dict[str, Any] | None = None
+        for code, value in status.items():
+            self[code] = value
+
+    def __getitem__(self, code: str) -> Any:
+        """Return the value of a DP code."""
+        if (slot := self._schema.index.get(code)) is not None:
+            if (value := self._values[slot]) is not _MISSING:
+                return value
+        elif self._extra is not None and code in self._extra:
+            return self._extra[code]
+        raise KeyError(code)
+
+    def get(self, code: str, default: Any = None) -> Any:
+        """Return the value of a DP code, or the default."""
+        if (slot := self._schema.index.get(code)) is not None:
+            if (value := self._values[slot]) is not _MISSING:
+                return value
+            return default
+        if self._extra is not None:
+            return self._extra.get(code, default)
+        return default
+
+    def __contains__(self, code: object) -> bool:
+        """Return if a value is known for a DP code."""
+        if not isinstance(code, str):
+            return False
+        if (slot := self._schema.index.get(code)) is not None:
+            return self._values[slot] is not _MISSING
+        return self._extra is not None and code in self._extra
+
+    def __setitem__(self, code: str, value: Any) -> None:
+        """Set the value of a DP code."""
+        if (slot := self._schema.index.get(code)) is not None:
+            self._values[slot] = value
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[code] = value
+
+    def __delitem__(self, code: str) -> None:
+        """Remove the value of a DP code."""
+        if (slot := self._schema.index.get(code)) is not None:
+            if self._values[slot] is _MISSING:
+                raise KeyError(code)
+            self._values[slot] = _MISSING
+            return
+        if self._extra is None:
+            raise KeyError(code)
+        del self._extra[code]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the DP codes that have a value."""
+        values = self._values
+        for code, slot in self._schema.index.items():
+            if values[slot] is not _MISSING:
+                yield code
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        """Return the number of DP codes that have a value."""
+        count = sum(value is not _MISSING for value in self._values)
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def __repr__(self) -> str:
+        """Return the status as a dictionary representation."""
+        return repr(dict(self.items()))
+
+
+class CompactDeviceStore:
+    """Interns product schemas and compacts the status of Tuya devices."""
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self.schemas: dict[str, ProductSchema] = {}
+
+    def compact(self, device: CustomerDevice) -> None:
+        """Share the product schema with a device and compact its status."""
+        if isinstance(device.status, CompactStatus):
+            return
+
+        if (schema := self.schemas.get(device.product_id)) is None:
+            schema = self.schemas[device.product_id] = ProductSchema(device)
+        elif not schema.matches(device):
+            # Devices of a product are expected to share a schema; a device
+            # that doesn't (e.g. other firmware) is left as is.
+            return
+
+        device.function = schema.function
+        device.status_range = schema.status_range
+        device.status = CompactStatus(schema, device.status)
+
+
+def _schema_fingerprint(device: CustomerDevice) -> tuple[Any, ...]:
+    """Return a hashable representation of the schema of a device."""
+    return tuple(
+        tuple((code, item.type, item.values) for code, item in items.items())
+        for items in (device.function, device.status_range)
+    )
+
+
+def deep_getsizeof(obj: Any, seen: set[int]) -> int:
+    """Return the approximate memory used by an object and its contents.
+
+    Objects in seen are not counted, which allows shared objects to be
+    counted only once across multiple calls.
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, Mapping):
+        size += sum(
+            deep_getsizeof(key, seen) + deep_getsizeof(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_getsizeof(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_getsizeof(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if (value := getattr(obj, slot, _MISSING)) is not _MISSING:
+            size += deep_getsizeof(value, seen)
+    return size
+
+
+def device_memory_usage(device: CustomerDevice, seen: set[int] | None = None) -> int:
+    """Return the approximate memory used by the schema and status of a device."""
+    if seen is None:
+        seen = set()
+    return sum(
+        deep_getsizeof(part, seen)
+        for part in (device.function, device.status_range, device.status)
+    )
+
+
+def memory_report(devices: Iterable[CustomerDevice]) -> dict[str, Any]:
+    """Return the memory used by devices, in total and per product.
+
+    Schemas shared between devices of a product are counted once.
+    """
+    seen: set[int] = set()
+    products: dict[str, dict[str, int]] = {}
+    total = 0
+    for device in devices:
+        size = device_memory_usage(device, seen)
+        total += size
+        product = products.setdefault(device.product_id, {"devices": 0, "bytes": 0})
+        product["devices"] += 1
+        product["bytes"] += size
+    return {"bytes": total, "products": products}
@@ -1,6 +1,10 @@
 """Utility methods for the Tuya integration."""
 from __future__ import annotations
 
+from functools import lru_cache
+
+from .const import DEVICE_CLASS_UNITS, UnitOfMeasurement
+
 
 def remap_value(
     value: float | int,
@@ -14,3 +18,11 @@ def remap_value(
     if reverse:
         value = from_max - value + from_min
     return ((value - from_min) / (from_max - from_min)) * (to_max - to_min) + to_min
+
+
+@lru_cache
+def get_unit_of_measurement(device_class: str, unit: str) -> UnitOfMeasurement | None:
+    """Return the unit of measurement for a device class and a Tuya unit."""
+    if (uoms := DEVICE_CLASS_UNITS.get(device_class)) is None:
+        return None
+    return uoms.get(unit) or uoms.get(unit.lower())
@@ -0,0 +1,188 @@
+"""Tests for the cached directory of Tuya lock members."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.tuya import members
+from custom_components.tuya.const import (
+    LOCK_MEMBERS_PATH,
+    LOCK_MEMBERS_RETRY,
+    LOCK_MEMBERS_TTL,
+)
+from custom_components.tuya.members import LockMemberDirectory, parse_members
+
+DEVICE_ID = "lock1"
+
+USER = {
+    "lock_user_id": 7,
+    "nick_name": "Alice",
+    "unlock_detail": [
+        {
+            "dp_code": "unlock_fingerprint",
+            "unlock_list": [{"unlock_sn": 3}, {"unlock_name": "no number"}],
+        },
+        {"unlock_list": [{"unlock_sn": 4}]},
+    ],
+}
+MEMBER = {
+    "user_id": "7",
+    "name": "Alice",
+    "credentials": [["unlock_fingerprint", "3"]],
+}
+
+
+class FakeHass:
+    """Runs executor jobs inline and records scheduled jobs."""
+
+    def __init__(self) -> None:
+        """Initialize the fake."""
+        self.jobs: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+
+    def add_job(self, target: Callable[..., Any], *args: Any) -> None:
+        """Record a scheduled job."""
+        self.jobs.append((target, args))
+
+    async def async_add_executor_job(
+        self, target: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a job inline."""
+        return target(*args)
+
+
+class FakeStore:
+    """Keeps the saved data in memory."""
+
+    def __init__(self, hass: FakeHass, version: int, key: str) -> None:
+        """Initialize the fake."""
+        self.data: Any = None
+
+    async def async_load(self) -> Any:
+        """Return the saved data."""
+        return self.data
+
+    def async_delay_save(self, data_func: Callable[[], Any], delay: float) -> None:
+        """Save the data right away."""
+        self.data = data_func()
+
+
+class FakeCustomerAPI:
+    """Returns a fixed response, recording the requested paths."""
+
+    def __init__(self, response: dict[str, Any] | None) -> None:
+        """Initialize the fake."""
+        self.response = response
+        self.paths: list[str] = []
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Return the response."""
+        self.paths.append(path)
+        return self.response
+
+
+@pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Control the wall clock of the member directory."""
+    clock = [1_000_000.0]
+    monkeypatch.setattr(members.time, "time", lambda: clock[0])
+    return clock
+
+
+def _directory(
+    monkeypatch: pytest.MonkeyPatch, response: dict[str, Any] | None
+) -> tuple[LockMemberDirectory, FakeHass, FakeCustomerAPI]:
+    """Return a member directory fetching the given response."""
+    monkeypatch.setattr(members, "Store", FakeStore)
+    hass = FakeHass()
+    api = FakeCustomerAPI(response)
+    manager = SimpleNamespace(customer_api=api, device_map={})
+    return LockMemberDirectory(hass, manager, "entry"), hass, api
+
+
+@pytest.mark.parametrize(
+    "result",
+    [{"list": [USER]}, {"users": [USER]}, [USER]],
+    ids=["list", "users", "plain"],
+)
+def test_parse_members_shapes(result: Any) -> None:
+    """Test the members are parsed from each response shape."""
+    assert parse_members(result) == [MEMBER]
+
+
+def test_parse_members_fallback_keys() -> None:
+    """Test the user ID and name fall back to the alternative keys."""
+    assert parse_members([{"user_id": "u1", "user_name": "Bob"}]) == [
+        {"user_id": "u1", "name": "Bob", "credentials": []}
+    ]
+
+
+@pytest.mark.parametrize(
+    "result",
+    [None, "users", 3, {}, {"list": None}, {"list": ["junk", 3]}],
+)
+def test_parse_members_junk(result: Any) -> None:
+    """Test unexpected responses result in no members."""
+    assert parse_members(result) == []
+
+
+def test_refresh_caches_until_expired(
+    monkeypatch: pytest.MonkeyPatch, now: list[float]
+) -> None:
+    """Test the members are fetched once, and again after the maximum age."""
+    directory, hass, api = _directory(
+        monkeypatch, {"success": True, "result": {"list": [USER]}}
+    )
+
+    asyncio.run(directory.async_refresh(DEVICE_ID, LOCK_MEMBERS_TTL))
+    assert api.paths == [LOCK_MEMBERS_PATH.format(device_id=DEVICE_ID)]
+    assert directory.resolve(DEVICE_ID, "unlock_fingerprint", 3) == "Alice"
+    assert directory.resolve(DEVICE_ID, "unlock_card", 7) == "Alice"
+    assert directory._store.data[DEVICE_ID]["members"] == [MEMBER]
+
+    now[0] += LOCK_MEMBERS_TTL - 1
+    asyncio.run(directory.async_refresh(DEVICE_ID, LOCK_MEMBERS_TTL))
+    assert len(api.paths) == 1
+
+    now[0] += 2
+    asyncio.run(directory.async_refresh(DEVICE_ID, LOCK_MEMBERS_TTL))
+    assert len(api.paths) == 2
+    assert not hass.jobs
+
+
+def test_failed_refresh_is_retried_after_max_age(
+    monkeypatch: pytest.MonkeyPatch, now: list[float]
+) -> None:
+    """Test a failed fetch is not retried within the maximum age."""
+    directory, _, api = _directory(monkeypatch, {"success": False, "msg": "busy"})
+
+    asyncio.run(directory.async_refresh(DEVICE_ID, LOCK_MEMBERS_RETRY))
+    asyncio.run(directory.async_refresh(DEVICE_ID, LOCK_MEMBERS_RETRY))
+    assert len(api.paths) == 1
+    assert directory._store.data is None
+
+    now[0] += LOCK_MEMBERS_RETRY + 1
+    api.response = {"success": True, "result": [USER]}
+    asyncio.run(directory.async_refresh(DEVICE_ID, LOCK_MEMBERS_RETRY))
+    assert len(api.paths) == 2
+    assert directory.resolve(DEVICE_ID, "unlock_fingerprint", "3") == "Alice"
+
+
+def test_resolve_miss_schedules_refresh(
+    monkeypatch: pytest.MonkeyPatch, now: list[float]
+) -> None:
+    """Test an unknown value schedules a refresh, a known value does not."""
+    directory, hass, _ = _directory(monkeypatch, {"success": True, "result": [USER]})
+    asyncio.run(directory.async_refresh(DEVICE_ID, LOCK_MEMBERS_TTL))
+
+    assert directory.resolve(DEVICE_ID, "unlock_fingerprint", 3) == "Alice"
+    assert not hass.jobs
+
+    assert directory.resolve(DEVICE_ID, "unlock_fingerprint", 9) is None
+    assert hass.jobs == [(directory.async_refresh, (DEVICE_ID, LOCK_MEMBERS_RETRY))]
+
+    assert directory.resolve("lock2", "unlock_card", 1) is None
+    assert hass.jobs[-1] == (directory.async_refresh, ("lock2", LOCK_MEMBERS_RETRY))